@@ -19,6 +19,12 @@ src_dir = spec_dir / "src"
 if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
+# Regenerate the pre-minified theme on every build so it matches the templates
+if str(spec_dir) not in sys.path:
+    sys.path.insert(0, str(spec_dir))
+from build_theme import write_prebuilt_theme
+prebuilt_theme_dir = write_prebuilt_theme()
+
 # Collect all submodules - this should work now
 try:
     ui_modules = collect_submodules('ui')
@@ -58,7 +64,9 @@ a = Analysis(
     binaries=[],
     datas=[
         ('src/images', 'images'),
-        ('src/i18n/locales', 'i18n/locales')
+        ('src/i18n/locales', 'i18n/locales'),
+        ('src/ui/themes', 'ui/themes'),
+        (str(prebuilt_theme_dir), 'ui/themes')
     ],
     hiddenimports=[
         # Collect all submodules
@@ -1,11 +1,17 @@
 # -*- mode: python ; coding: utf-8 -*-
+import sys
+
+# Regenerate the pre-minified theme on every build so it matches the templates
+sys.path.insert(0, SPECPATH)
+from build_theme import write_prebuilt_theme
+prebuilt_theme_dir = write_prebuilt_theme()
 
 
 a = Analysis(
     ['src\\app\\main.py'],
     pathex=['src'],
     binaries=[],
-    datas=[('src/i18n/locales', 'i18n/locales')],
+    datas=[('src/i18n/locales', 'i18n/locales'), ('src/ui/themes', 'ui/themes'), (str(prebuilt_theme_dir), 'ui/themes')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -3,6 +3,8 @@ import PyInstaller.__main__
 import sys
 from pathlib import Path
 
+from build_theme import write_prebuilt_theme
+
 def build():
     """Build the application executable."""
     # Paths
@@ -21,6 +23,10 @@ def build():
         else:
             icon_path = ico_path
     
+    # Ship the theme pre-minified so the app doesn't render it at startup;
+    # regenerated on every build so it always matches the templates
+    prebuilt_theme_dir = write_prebuilt_theme()
+    
     # PyInstaller arguments
     args = [
         str(main_script),
@@ -38,13 +44,18 @@ def build():
     else:
         print(f"Warning: Icon not found at {icon_path}")
     
-    # Add data files (images, locales)
+    # Add data files (images, locales, themes)
     if (src_dir / "images").exists():
         args.append(f"--add-data={src_dir / 'images'};images")
     
     if (src_dir / "i18n" / "locales").exists():
         args.append(f"--add-data={src_dir / 'i18n' / 'locales'};i18n/locales")
     
+    if (src_dir / "ui" / "themes").exists():
+        args.append(f"--add-data={src_dir / 'ui' / 'themes'};ui/themes")
+    
+    args.append(f"--add-data={prebuilt_theme_dir};ui/themes")
+    
     # Hidden imports
     args.extend([
         "--hidden-import=PySide6.QtCore",
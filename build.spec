@@ -14,6 +14,12 @@ src_dir = Path(SPECPATH) / "src"
 app_dir = src_dir / "app"
 images_dir = src_dir / "images"
 locales_dir = src_dir / "i18n" / "locales"
+themes_dir = src_dir / "ui" / "themes"
+
+# Regenerate the pre-minified theme on every build so it matches the templates
+sys.path.insert(0, SPECPATH)
+from build_theme import write_prebuilt_theme
+prebuilt_theme_dir = write_prebuilt_theme()
 
 # Icon path
 icon_path = images_dir / "avatar.png"
@@ -32,6 +38,8 @@ a = Analysis(
     datas=[
         (str(images_dir), "images") if images_dir.exists() else None,
         (str(locales_dir), "i18n/locales") if locales_dir.exists() else None,
+        (str(themes_dir), "ui/themes") if themes_dir.exists() else None,
+        (str(prebuilt_theme_dir), "ui/themes"),
     ],
     hiddenimports=[
         "PySide6.QtCore",
@@ -0,0 +1,34 @@
+"""Pre-minify the dark theme stylesheets for packaging."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from ui.theme import THEME_SHEETS, prebuilt_filename, render_theme_qss
+
+# Generated into the build tree, never next to the templates, so a source
+# checkout can't pick up a stale copy
+PREBUILT_THEME_DIR = Path(__file__).parent / "build" / "theme"
+# Where earlier versions of this script wrote them
+_LEGACY_THEME_DIR = Path(__file__).parent / "src" / "ui" / "themes"
+
+
+def write_prebuilt_theme(out_dir=PREBUILT_THEME_DIR):
+    """Regenerate the minified .min.qss files in out_dir and return it."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # Drop leftovers from earlier builds so only current sheets get packaged
+    for stale_dir in (out_dir, _LEGACY_THEME_DIR):
+        for stale in stale_dir.glob("*.min.qss"):
+            stale.unlink()
+    
+    for name, qss in zip(THEME_SHEETS, render_theme_qss()):
+        path = out_dir / prebuilt_filename(name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(qss)
+        print(f"Wrote {path} ({len(qss)} bytes)")
+    return out_dir
+
+
+if __name__ == "__main__":
+    write_prebuilt_theme()
@@ -194,6 +194,8 @@ def main():
     # Create and show main window
     window = MainWindow(config_store, translator, icon_path if icon_path.exists() else None, is_startup_launch)
     window.show()
+    # Schedule the startup trigger only once the UI is visible
+    window.start_startup_check()
     
     sys.exit(app.exec())
 
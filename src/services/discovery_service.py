@@ -1,10 +1,9 @@
 """Discovery service for scanning installed apps."""
 import os
-from pathlib import Path
 from typing import List, Dict
 from PySide6.QtCore import QThread, Signal
 
-from utils.paths import get_start_menu_paths
+from utils.paths import get_start_menu_paths_str
 
 
 class AppInfo:
@@ -24,17 +23,15 @@ class DiscoveryWorker(QThread):
     def run(self):
         """Scan Start Menu for .lnk files."""
         apps = []
-        start_menu_paths = get_start_menu_paths()
+        # Already filtered to existing folders
+        start_menu_paths = get_start_menu_paths_str()
         
         for base_path in start_menu_paths:
-            if not base_path.exists():
-                continue
-            
             # Walk through all subdirectories
             for root, dirs, files in os.walk(base_path):
                 for file in files:
                     if file.endswith('.lnk'):
-                        lnk_path = Path(root) / file
+                        lnk_path = os.path.join(root, file)
                         # Extract app name from filename (remove .lnk extension)
                         app_name = file[:-4]
                         
@@ -45,7 +42,7 @@ class DiscoveryWorker(QThread):
                         
                         apps.append(AppInfo(
                             name=app_name,
-                            lnk_path=str(lnk_path),
+                            lnk_path=lnk_path,
                             icon_path=None  # Can be extracted later if needed
                         ))
         
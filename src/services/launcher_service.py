@@ -4,12 +4,14 @@ import subprocess
 import ctypes
 from pathlib import Path
 
+from services.logging_service import get_logging_service
+
 
 class LauncherService:
     """Service for launching apps and browser URLs."""
     
     def __init__(self):
-        pass
+        self.logging_service = get_logging_service()
     
     def _resolve_lnk(self, lnk_path: str) -> str:
         """
@@ -39,7 +41,7 @@ class LauncherService:
             else:
                 return lnk_path
         except Exception as e:
-            print(f"Error resolving .lnk file {lnk_path}: {e}")
+            self.logging_service.error(f"Error resolving .lnk file {lnk_path}: {e}")
             return lnk_path
     
     def _launch_with_normal_user(self, target_path: str) -> bool:
@@ -67,7 +69,7 @@ class LauncherService:
             # ShellExecuteW returns > 32 on success
             return result > 32
         except Exception as e:
-            print(f"Error launching with ShellExecute: {e}")
+            self.logging_service.error(f"Error launching with ShellExecute: {e}")
             return False
     
     def launch_app(self, lnk_path: str):
@@ -80,18 +82,18 @@ class LauncherService:
             lnk_path: Path to the .lnk shortcut file
         """
         try:
-            print(f"Attempting to launch app from: {lnk_path}")
+            self.logging_service.debug("Attempting to launch app from: %s", lnk_path)
             
             # Check if file exists
             if not os.path.exists(lnk_path):
-                print(f"File not found: {lnk_path}")
+                self.logging_service.warning(f"File not found: {lnk_path}")
                 # Try to resolve .lnk to see if target exists
                 resolved = self._resolve_lnk(lnk_path)
                 if resolved != lnk_path and os.path.exists(resolved):
-                    print(f"Resolved path exists, trying to launch: {resolved}")
+                    self.logging_service.debug("Resolved path exists, trying to launch: %s", resolved)
                     # Use ShellExecute to launch with normal user privileges
                     if self._launch_with_normal_user(resolved):
-                        print(f"Successfully launched resolved path: {resolved}")
+                        self.logging_service.info(f"Successfully launched resolved path: {resolved}")
                         return True
                     else:
                         # Fallback: try os.startfile
@@ -99,35 +101,33 @@ class LauncherService:
                             os.startfile(resolved)
                             return True
                         except Exception as e2:
-                            print(f"Fallback also failed: {e2}")
+                            self.logging_service.warning(f"Fallback also failed: {e2}")
                 return False
             
             # Use ShellExecute to launch .lnk file with normal user privileges
             # ShellExecute with "open" operation runs with current user token, not admin
-            print(f"Launching .lnk file: {lnk_path}")
+            self.logging_service.debug("Launching .lnk file: %s", lnk_path)
             if self._launch_with_normal_user(lnk_path):
-                print(f"Successfully launched: {lnk_path}")
+                self.logging_service.info(f"Successfully launched: {lnk_path}")
                 return True
             else:
                 # Fallback: try os.startfile
                 try:
                     os.startfile(lnk_path)
-                    print(f"Launched via os.startfile: {lnk_path}")
+                    self.logging_service.info(f"Launched via os.startfile: {lnk_path}")
                     return True
                 except Exception as e:
-                    print(f"os.startfile also failed: {e}")
+                    self.logging_service.warning(f"os.startfile also failed: {e}")
                     return False
         except Exception as e:
-            print(f"Error launching app {lnk_path}: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logging_service.exception(f"Error launching app {lnk_path}: {e}")
             
             # Fallback: try to resolve and launch executable directly
             try:
-                print(f"Trying fallback: resolve and launch executable")
+                self.logging_service.debug("Trying fallback: resolve and launch executable")
                 exe_path = self._resolve_lnk(lnk_path)
                 if exe_path != lnk_path and os.path.exists(exe_path):
-                    print(f"Launching resolved executable: {exe_path}")
+                    self.logging_service.debug("Launching resolved executable: %s", exe_path)
                     # Try ShellExecute first
                     if self._launch_with_normal_user(exe_path):
                         return True
@@ -144,7 +144,7 @@ class LauncherService:
                         )
                         return True
             except Exception as e2:
-                print(f"Fallback also failed: {e2}")
+                self.logging_service.warning(f"Fallback also failed: {e2}")
             
             return False
     
@@ -162,7 +162,7 @@ class LauncherService:
         try:
             import time
             
-            print(f"Launching browser with {len(urls)} URLs: {urls}")
+            self.logging_service.debug("Launching browser with %d URLs: %s", len(urls), urls)
             
             # Strategy: Launch browser with first URL, then open remaining URLs using ShellExecuteW
             # ShellExecuteW with "open" verb will open each URL in a new tab of the running browser
@@ -171,12 +171,12 @@ class LauncherService:
             # Resolve .lnk file to get executable path
             exe_path = self._resolve_lnk(browser_lnk)
             
-            print(f"Resolved browser path: {exe_path}")
+            self.logging_service.debug("Resolved browser path: %s", exe_path)
             
             # Launch browser with first URL
             if os.path.exists(exe_path) and exe_path.lower().endswith('.exe'):
                 # Launch browser executable with first URL
-                print(f"Launching browser with first URL: {urls[0]}")
+                self.logging_service.debug("Launching browser with first URL: %s", urls[0])
                 result = ctypes.windll.shell32.ShellExecuteW(
                     None,           # hwnd
                     "open",         # lpOperation
@@ -186,40 +186,40 @@ class LauncherService:
                     1               # nShowCmd - SW_SHOWNORMAL
                 )
                 if result <= 32:
-                    print(f"Failed to launch browser with first URL. Error code: {result}")
+                    self.logging_service.warning(f"Failed to launch browser with first URL. Error code: {result}")
                     # Fallback: try launching .lnk directly
                     result = ctypes.windll.shell32.ShellExecuteW(
                         None, "open", browser_lnk, None, None, 1
                     )
                     if result <= 32:
-                        print(f"Failed to launch browser .lnk. Error code: {result}")
+                        self.logging_service.warning(f"Failed to launch browser .lnk. Error code: {result}")
                         return False
             else:
                 # Launch .lnk file directly
-                print(f"Launching browser .lnk: {browser_lnk}")
+                self.logging_service.debug("Launching browser .lnk: %s", browser_lnk)
                 result = ctypes.windll.shell32.ShellExecuteW(
                     None, "open", browser_lnk, None, None, 1
                 )
                 if result <= 32:
-                    print(f"Failed to launch browser .lnk. Error code: {result}")
+                    self.logging_service.warning(f"Failed to launch browser .lnk. Error code: {result}")
                     return False
                 # Open first URL separately
-                print(f"Opening first URL: {urls[0]}")
+                self.logging_service.debug("Opening first URL: %s", urls[0])
                 result = ctypes.windll.shell32.ShellExecuteW(
                     None, "open", urls[0], None, None, 1
                 )
                 if result <= 32:
-                    print(f"Failed to open first URL. Error code: {result}")
+                    self.logging_service.warning(f"Failed to open first URL. Error code: {result}")
             
             # Wait for browser to fully start before opening additional URLs
-            print("Waiting for browser to start...")
+            self.logging_service.debug("Waiting for browser to start...")
             time.sleep(1.0)  # Increased delay to ensure browser is ready
             
             # Step 2: Open remaining URLs - each will open in a new tab
             success_count = 1  # First URL already opened
             for i, url in enumerate(urls[1:], start=2):
                 try:
-                    print(f"Opening URL {i}/{len(urls)}: {url}")
+                    self.logging_service.debug("Opening URL %d/%d: %s", i, len(urls), url)
                     # Use ShellExecuteW with "open" verb - this will open URL in a new tab
                     result = ctypes.windll.shell32.ShellExecuteW(
                         None,           # hwnd
@@ -231,26 +231,22 @@ class LauncherService:
                     )
                     
                     if result > 32:
-                        print(f"✅ Successfully opened URL {i}: {url}")
+                        self.logging_service.info(f"✅ Successfully opened URL {i}: {url}")
                         success_count += 1
                     else:
-                        print(f"❌ Failed to open URL {i}: {url}. Error code: {result}")
+                        self.logging_service.warning(f"❌ Failed to open URL {i}: {url}. Error code: {result}")
                     
                     # Small delay between URLs to avoid overwhelming the browser
                     if i < len(urls):  # Don't delay after the last one
                         time.sleep(0.3)
                 except Exception as e:
-                    print(f"❌ Error opening URL {url}: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    self.logging_service.exception(f"❌ Error opening URL {url}: {e}")
             
-            print(f"Successfully opened {success_count}/{len(urls)} URLs")
+            self.logging_service.info(f"Successfully opened {success_count}/{len(urls)} URLs")
             return success_count > 0
             
         except Exception as e:
-            print(f"Error launching browser URLs: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logging_service.exception(f"Error launching browser URLs: {e}")
             return False
     
     def test_favourite(self, favourite):
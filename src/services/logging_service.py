@@ -1,5 +1,7 @@
 """Logging service for application logs."""
+import io
 import logging
+import mmap
 import os
 from pathlib import Path
 from datetime import datetime
@@ -51,9 +53,9 @@ class LoggingService:
             console_handler.setFormatter(formatter)
             self.logger.addHandler(console_handler)
     
-    def debug(self, message: str):
-        """Log debug message."""
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        """Log debug message; args are %-formatted only if debug is enabled."""
+        self.logger.debug(message, *args)
     
     def info(self, message: str):
         """Log info message."""
@@ -71,6 +73,10 @@ class LoggingService:
         """Log exception with traceback."""
         self.logger.exception(message)
     
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether messages at level would be logged, to skip building them."""
+        return self.logger.isEnabledFor(level)
+    
     def get_logs(self, lines: int = 1000) -> list:
         """
         Get recent log lines from file.
@@ -92,6 +98,108 @@ class LoggingService:
         except Exception as e:
             return [f"Error reading logs: {e}"]
     
+    def get_log_file_state(self):
+        """
+        Get a cheap fingerprint of the log file for change detection.
+        
+        Returns:
+            Tuple of (mtime_ns, size), or None if the file does not exist
+        """
+        try:
+            stat = os.stat(self.log_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def get_logs_tail(self, max_lines: int = 1000) -> list:
+        """
+        Get recent log lines by reading only the tail of the log file.
+        
+        The file is memory-mapped and scanned backwards for line breaks, so
+        only the bytes of the last ``max_lines`` lines are decoded regardless
+        of the total file size.
+        
+        Args:
+            max_lines: Number of lines to retrieve (default: 1000)
+        
+        Returns:
+            List of log lines (most recent first)
+        """
+        return self.get_logs_tail_with_offset(max_lines)[0]
+    
+    def get_logs_tail_with_offset(self, max_lines: int = 1000) -> tuple:
+        """
+        Get recent log lines and the byte offset they were read up to.
+        
+        Only complete lines are returned and the offset points just past the
+        last line break, so it can be passed to ``get_logs_since`` to read
+        only the lines appended afterwards (including the rest of a line that
+        was still being written).
+        
+        Args:
+            max_lines: Number of lines to retrieve (default: 1000)
+        
+        Returns:
+            Tuple of (log lines most recent first, end offset). The offset is
+            None if the file could not be read.
+        """
+        try:
+            if not self.log_file.exists():
+                return [], 0
+            
+            with open(self.log_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return [], 0
+                
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Stop at the last complete line; a partially written
+                    # line is left for get_logs_since
+                    end = mm.rfind(b'\n') + 1
+                    if end == 0:
+                        return [], 0
+                    pos = end - 1
+                    for _ in range(max_lines):
+                        pos = mm.rfind(b'\n', 0, pos)
+                        if pos == -1:
+                            break
+                    data = mm[pos + 1:end]
+            
+            text = data.decode('utf-8', errors='replace')
+            lines = io.StringIO(text, newline=None).readlines()
+            # Reversed so most recent is first
+            return list(reversed(lines)), end
+        except Exception as e:
+            return [f"Error reading logs: {e}"], None
+    
+    def get_logs_since(self, offset: int):
+        """
+        Get log lines appended after a byte offset.
+        
+        Only complete lines are returned; a partially written last line is
+        left for the next call.
+        
+        Args:
+            offset: Byte offset returned by a previous read
+        
+        Returns:
+            Tuple of (new log lines in file order, new offset), or None if the
+            file shrank (cleared or rotated) or could not be read
+        """
+        try:
+            with open(self.log_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < offset:
+                    return None
+                f.seek(offset)
+                data = f.read(size - offset)
+        except OSError:
+            return None
+        
+        end = data.rfind(b'\n') + 1
+        text = data[:end].decode('utf-8', errors='replace')
+        return io.StringIO(text, newline=None).readlines(), offset + end
+    
     def clear_logs(self):
         """Clear all logs."""
         try:
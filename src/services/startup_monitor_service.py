@@ -3,7 +3,7 @@ import subprocess
 import os
 import winreg
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 
 
@@ -16,7 +16,9 @@ class StartupAppInfo:
         self.path = path
         self.status = status  # running, stopped, error
         self.process_id = None
-        self.memory_usage = None
+        self.memory_usage = None  # Raw tasklist value, e.g. "12,345 K"
+        self.memory_kb: Optional[int] = None
+        self.memory_mb: Optional[float] = None
         self.start_time = None
 
 
@@ -199,6 +201,9 @@ class StartupMonitorService:
                             app.status = "running"
                             app.process_id = proc_info['pid']
                             app.memory_usage = proc_info['memory']
+                            app.memory_kb = self._parse_memory_kb(proc_info['memory'])
+                            if app.memory_kb is not None:
+                                app.memory_mb = app.memory_kb / 1024
                             break
                     else:
                         app.status = "stopped"
@@ -207,6 +212,12 @@ class StartupMonitorService:
             for app in apps:
                 app.status = "unknown"
     
+    @staticmethod
+    def _parse_memory_kb(memory: str) -> Optional[int]:
+        """Parse a tasklist memory value such as "12,345 K" into kilobytes."""
+        digits = "".join(ch for ch in memory if ch.isdigit())
+        return int(digits) if digits else None
+    
     def get_system_info(self) -> Dict:
         """Get system information."""
         info = {
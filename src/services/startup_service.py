@@ -4,6 +4,8 @@ import sys
 import os
 from pathlib import Path
 
+from services.logging_service import get_logging_service
+
 
 class StartupService:
     """Service for managing Windows autostart via Task Scheduler."""
@@ -11,7 +13,7 @@ class StartupService:
     TASK_NAME = "StarterAppLauncher_AutoStart"
     
     def __init__(self):
-        pass
+        self.logging_service = get_logging_service()
     
     def is_enabled(self) -> bool:
         """
@@ -29,7 +31,7 @@ class StartupService:
             )
             return result.returncode == 0
         except Exception as e:
-            print(f"Error checking autostart status: {e}")
+            self.logging_service.error(f"Error checking autostart status: {e}")
             return False
     
     def enable(self) -> bool:
@@ -50,7 +52,7 @@ class StartupService:
                 # Running as Python script
                 main_script = Path(__file__).parent.parent / "app" / "main.py"
                 if not main_script.exists():
-                    print(f"Main script not found: {main_script}")
+                    self.logging_service.error(f"Main script not found: {main_script}")
                     return False
                 
                 # Use pythonw to avoid console window
@@ -60,7 +62,7 @@ class StartupService:
                 
                 task_command = f'"{python_exe}" "{main_script}" --startup'
             
-            print(f"Creating autostart task with command: {task_command}")
+            self.logging_service.debug("Creating autostart task with command: %s", task_command)
             
             # Create scheduled task
             # /SC ONLOGON: Run at logon
@@ -77,7 +79,7 @@ class StartupService:
                 "/F"
             ]
             
-            print(f"Running command: {' '.join(command)}")
+            self.logging_service.debug("Running command: %s", ' '.join(command))
             
             result = subprocess.run(
                 command,
@@ -87,20 +89,18 @@ class StartupService:
             )
             
             if result.returncode == 0:
-                print(f"Autostart enabled successfully")
-                print(f"Task output: {result.stdout}")
+                self.logging_service.info(f"Autostart enabled successfully")
+                self.logging_service.debug("Task output: %s", result.stdout)
                 return True
             else:
-                print(f"Failed to enable autostart")
-                print(f"Return code: {result.returncode}")
-                print(f"Stdout: {result.stdout}")
-                print(f"Stderr: {result.stderr}")
+                self.logging_service.error(f"Failed to enable autostart")
+                self.logging_service.error(f"Return code: {result.returncode}")
+                self.logging_service.error(f"Stdout: {result.stdout}")
+                self.logging_service.error(f"Stderr: {result.stderr}")
                 return False
                 
         except Exception as e:
-            print(f"Error enabling autostart: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logging_service.exception(f"Error enabling autostart: {e}")
             return False
     
     def disable(self) -> bool:
@@ -119,13 +119,13 @@ class StartupService:
             )
             
             if result.returncode == 0:
-                print(f"Autostart disabled successfully")
+                self.logging_service.info(f"Autostart disabled successfully")
                 return True
             else:
-                print(f"Failed to disable autostart: {result.stderr}")
+                self.logging_service.error(f"Failed to disable autostart: {result.stderr}")
                 return False
                 
         except Exception as e:
-            print(f"Error disabling autostart: {e}")
+            self.logging_service.error(f"Error disabling autostart: {e}")
             return False
 
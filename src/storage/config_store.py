@@ -2,7 +2,7 @@
 import json
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from models.config_models import AppConfig, UIConfig, AdminConfig, StarterSettings, Favourite
 
@@ -125,6 +125,13 @@ class ConfigStore:
         """Get favourites list."""
         return self.config.favourites if self.config else []
     
+    def get_selected_favourites(self) -> Iterator[Favourite]:
+        """Iterate over selected favourites without building an intermediate list."""
+        if self.config:
+            for fav in self.config.favourites:
+                if fav.selected:
+                    yield fav
+    
     def add_favourite(self, favourite: Favourite):
         """Add favourite and save."""
         if self.config:
@@ -0,0 +1,16 @@
+"""Shared qtawesome icon cache."""
+import functools
+
+import qtawesome as qta
+
+
+@functools.lru_cache(maxsize=None)
+def get_icon(name: str, color: str = "white"):
+    """Get a qtawesome icon, built once per (name, color) pair."""
+    return qta.icon(name, color=color)
+
+
+@functools.lru_cache(maxsize=None)
+def get_pixmap(name: str, color: str = "white", size: int = 16):
+    """Get a square pixmap of a qtawesome icon, rendered once per (name, color, size)."""
+    return get_icon(name, color).pixmap(size, size)
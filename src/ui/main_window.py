@@ -1,7 +1,7 @@
 """Main application window with sidebar and content area."""
 from pathlib import Path
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
+    QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
     QPushButton, QLabel, QStackedWidget
 )
 from PySide6.QtCore import Qt, Signal, QTimer, QThread
@@ -166,6 +166,7 @@ class MainWindow(QMainWindow):
         self.config_store = config_store
         self.translator = translator
         self.is_startup_launch = is_startup_launch
+        self._startup_check_started = False
         self.email_service = EmailRegistrationService()
         
         self.setWindowTitle("Starter App Launcher (Beta)")
@@ -176,7 +177,7 @@ class MainWindow(QMainWindow):
             self.setWindowIcon(QIcon(str(icon_path)))
         
         # Apply theme
-        apply_theme(self)
+        apply_theme(QApplication.instance(), self)
         
         self.init_ui()
         
@@ -219,6 +220,11 @@ class MainWindow(QMainWindow):
         # Connect tools page signal to navigate to clipboard history
         self.tools_page.view_clipboard_history.connect(self.show_clipboard_history)
         
+        # Keep the starter settings autostart status in sync with admin changes
+        self.admin_page.settings_tab.autostart_changed.connect(
+            lambda _enabled: self.starter_page.settings_tab.invalidate_autostart_cache()
+        )
+        
         self.content_stack.addWidget(self.starter_page)
         self.content_stack.addWidget(self.tools_page)
         self.content_stack.addWidget(self.admin_page)
@@ -298,6 +304,12 @@ class MainWindow(QMainWindow):
             self.email_dialog.show_error(error_message)
             print(f"Email registration failed: {error_message}")
     
+    def start_startup_check(self):
+        """Start the startup trigger check (once), after the window is shown."""
+        if not self._startup_check_started:
+            self._startup_check_started = True
+            self.starter_page.settings_tab.start_startup_check()
+    
     def resizeEvent(self, event):
         """Handle window resize to update overlay position."""
         super().resizeEvent(event)
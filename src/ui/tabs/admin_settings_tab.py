@@ -2,7 +2,7 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QCheckBox, QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
 import ctypes
 import sys
 
@@ -12,6 +12,8 @@ from services.startup_service import StartupService
 class AdminSettingsTab(QWidget):
     """Admin Settings tab combining Trigger and Rules functionality."""
     
+    autostart_changed = Signal(bool)  # Signal when autostart is enabled/disabled
+    
     def __init__(self, config_store, translator, parent=None):
         super().__init__(parent)
         self.config_store = config_store
@@ -172,6 +174,7 @@ class AdminSettingsTab(QWidget):
             if success:
                 self.config_store.set_autostart_enabled(True)
                 self.update_trigger_status_label(True)
+                self.autostart_changed.emit(True)
             else:
                 self.autostart_checkbox.setChecked(False)
                 QMessageBox.warning(
@@ -184,6 +187,7 @@ class AdminSettingsTab(QWidget):
             if success:
                 self.config_store.set_autostart_enabled(False)
                 self.update_trigger_status_label(False)
+                self.autostart_changed.emit(False)
             else:
                 self.autostart_checkbox.setChecked(True)
                 QMessageBox.warning(
@@ -1,13 +1,57 @@
 """Logs tab for viewing application logs."""
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QFileDialog, QMessageBox, QLineEdit
+    QPlainTextEdit, QFileDialog, QMessageBox, QLineEdit
 )
-from PySide6.QtCore import Qt, QTimer
-import qtawesome as qta
+from PySide6.QtCore import Qt, QTimer, QEvent
+from PySide6.QtGui import QColor, QSyntaxHighlighter, QTextCharFormat, QTextCursor
+import re
+from collections import deque
 from pathlib import Path
 
 from services.logging_service import get_logging_service
+from ui.icons import get_icon
+
+
+# Color mapping for log levels
+LEVEL_COLORS = {
+    "ERROR": "#f85149",    # Red for errors
+    "WARNING": "#d29922",  # Yellow/Orange for warnings
+    "INFO": "#3fb950",     # Green for info
+    "DEBUG": "#8b949e",    # Gray for debug
+}
+
+_LEVEL_RE = re.compile(r" - (ERROR|WARNING|INFO|DEBUG) - ")
+
+# Number of log lines kept in the view
+MAX_LOG_LINES = 1000
+
+# Auto-refresh intervals: base while the window is active, base while it is
+# inactive, and the cap reached by backing off when the log stays unchanged
+REFRESH_INTERVAL_MS = 2000
+INACTIVE_REFRESH_INTERVAL_MS = 10000
+MAX_REFRESH_INTERVAL_MS = 30000
+
+# Appends larger than this are handled with a full tail reload instead
+_MAX_APPEND_BYTES = 256 * 1024
+
+
+class LogHighlighter(QSyntaxHighlighter):
+    """Colorizes log lines by level as the document is laid out."""
+    
+    def __init__(self, document):
+        super().__init__(document)
+        self._formats = {}
+        for level, color in LEVEL_COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[level] = fmt
+    
+    def highlightBlock(self, text):
+        """Apply the level color to a single log line."""
+        match = _LEVEL_RE.search(text)
+        if match:
+            self.setFormat(0, len(text), self._formats[match.group(1)])
 
 
 class LogsTab(QWidget):
@@ -19,13 +63,21 @@ class LogsTab(QWidget):
         self.translator = translator
         self.logging_service = get_logging_service()
         self.auto_refresh = True
+        self._current_search = ""
+        self._search_pattern = None
+        self._log_file_state = None
+        self._log_offset = None
+        self._line_count = 0
+        self._all_lines = deque(maxlen=MAX_LOG_LINES)
+        self._idle_ticks = 0
+        self._loaded = False
+        # Status format string used on every refresh, re-resolved on language change
+        self._status_fmt = self.translator.t("admin.logs.status")
         self.init_ui()
-        self.load_logs()
         
-        # Auto-refresh timer (every 2 seconds)
+        # Auto-refresh timer, only runs while the tab is visible
         self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.load_logs)
-        self.refresh_timer.start(2000)
+        self.refresh_timer.timeout.connect(self.refresh_if_changed)
     
     def init_ui(self):
         """Initialize tab UI."""
@@ -57,7 +109,7 @@ class LogsTab(QWidget):
         
         # Auto-refresh toggle
         self.auto_refresh_button = QPushButton()
-        self.auto_refresh_button.setIcon(qta.icon('fa5s.sync', color='white'))
+        self.auto_refresh_button.setIcon(get_icon('fa5s.sync'))
         self.auto_refresh_button.setText("  " + self.translator.t("admin.logs.auto_refresh"))
         self.auto_refresh_button.setCheckable(True)
         self.auto_refresh_button.setChecked(True)
@@ -67,7 +119,7 @@ class LogsTab(QWidget):
         
         # Refresh button
         self.refresh_button = QPushButton()
-        self.refresh_button.setIcon(qta.icon('fa5s.sync', color='white'))
+        self.refresh_button.setIcon(get_icon('fa5s.sync'))
         self.refresh_button.setText("  " + self.translator.t("admin.logs.refresh"))
         self.refresh_button.clicked.connect(self.load_logs)
         self.refresh_button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -75,7 +127,7 @@ class LogsTab(QWidget):
         
         # Clear button
         self.clear_button = QPushButton()
-        self.clear_button.setIcon(qta.icon('fa5s.trash', color='white'))
+        self.clear_button.setIcon(get_icon('fa5s.trash'))
         self.clear_button.setText("  " + self.translator.t("admin.logs.clear"))
         self.clear_button.clicked.connect(self.on_clear_logs)
         self.clear_button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -84,7 +136,7 @@ class LogsTab(QWidget):
         
         # Export button
         self.export_button = QPushButton()
-        self.export_button.setIcon(qta.icon('fa5s.download', color='white'))
+        self.export_button.setIcon(get_icon('fa5s.download'))
         self.export_button.setText("  " + self.translator.t("admin.logs.export"))
         self.export_button.clicked.connect(self.on_export_logs)
         self.export_button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -95,10 +147,12 @@ class LogsTab(QWidget):
         layout.addSpacing(10)
         
         # Logs display - styled like terminal
-        self.logs_text = QTextEdit()
+        self.logs_text = QPlainTextEdit()
         self.logs_text.setReadOnly(True)
+        self.logs_text.setUndoRedoEnabled(False)
+        self.logs_text.setMaximumBlockCount(MAX_LOG_LINES)
         self.logs_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #0d1117;
                 color: #c9d1d9;
                 font-family: 'Consolas', 'Courier New', 'Monaco', monospace;
@@ -125,6 +179,7 @@ class LogsTab(QWidget):
                 height: 0px;
             }
         """)
+        self.highlighter = LogHighlighter(self.logs_text.document())
         self.logs_text.setPlaceholderText(self.translator.t("admin.logs.no_logs"))
         layout.addWidget(self.logs_text, 1)
         
@@ -133,90 +188,174 @@ class LogsTab(QWidget):
         self.status_label.setStyleSheet("color: #a0a0a0; font-size: 12px;")
         layout.addWidget(self.status_label)
     
-    def format_log_line(self, line: str) -> str:
-        """Format a log line with colors based on log level."""
-        line = line.rstrip('\n\r')
-        if not line:
-            return ""
+    def refresh_if_changed(self):
+        """Append new log lines if the log file changed since the last load."""
+        state = self.logging_service.get_log_file_state()
+        if state == self._log_file_state:
+            # Back off while nothing is being written
+            self._idle_ticks += 1
+            self._update_refresh_interval()
+            return
         
-        # Color mapping for log levels
-        if " - ERROR - " in line:
-            color = "#f85149"  # Red for errors
-        elif " - WARNING - " in line:
-            color = "#d29922"  # Yellow/Orange for warnings
-        elif " - INFO - " in line:
-            color = "#3fb950"  # Green for info
-        elif " - DEBUG - " in line:
-            color = "#8b949e"  # Gray for debug
-        else:
-            color = "#c9d1d9"  # Default text color
+        if self._idle_ticks:
+            self._idle_ticks = 0
+            self._update_refresh_interval()
         
-        # Escape HTML special characters
-        line_escaped = line.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        # Cleared, rotated or large jumps get a full reload
+        if (state is None or self._log_offset is None
+                or not self._log_offset <= state[1] <= self._log_offset + _MAX_APPEND_BYTES):
+            self.load_logs()
+            return
+        
+        result = self.logging_service.get_logs_since(self._log_offset)
+        if result is None:
+            self.load_logs()
+            return
         
-        # Format with color
-        return f'<span style="color: {color};">{line_escaped}</span><br>'
+        self._log_file_state = state
+        new_lines, self._log_offset = result
+        new_lines = [line for line in (line.rstrip('\n\r') for line in new_lines) if line]
+        self._all_lines.extend(new_lines)
+        
+        # Only the new tail needs to be checked against the filter
+        pattern = self._get_search_pattern()
+        if pattern is not None:
+            new_lines = list(filter(pattern.search, new_lines))
+        self._append_lines(new_lines)
     
     def load_logs(self):
         """Load and display logs with terminal-like styling."""
         try:
-            logs = self.logging_service.get_logs(lines=1000)
-            
-            # Filter by search term if provided
-            search_term = self.search_input.text().strip().lower()
-            if search_term:
-                logs = [line for line in logs if search_term in line.lower()]
-            
-            # Format logs with colors
-            formatted_logs = []
-            for line in logs:
-                formatted_logs.append(self.format_log_line(line))
-            
-            # Join formatted logs
-            html_content = ''.join(formatted_logs)
-            
-            # Store scroll position
-            scrollbar = self.logs_text.verticalScrollBar()
-            was_at_bottom = scrollbar.value() >= scrollbar.maximum() - 10
-            
-            # Set HTML content with terminal-like styling
-            self.logs_text.setHtml(f"""
-                <html>
-                <body style="background-color: #0d1117; color: #c9d1d9; font-family: 'Consolas', 'Courier New', 'Monaco', monospace; font-size: 12px; margin: 0; padding: 0;">
-                    {html_content if html_content else '<span style="color: #8b949e;">No logs available</span>'}
-                </body>
-                </html>
-            """)
-            
-            # Auto-scroll to bottom if was at bottom (for auto-refresh)
-            if was_at_bottom and self.auto_refresh:
-                scrollbar.setValue(scrollbar.maximum())
-            
-            # Update status
-            line_count = len(logs)
-            self.status_label.setText(
-                self.translator.t("admin.logs.status").format(count=line_count)
+            self._log_file_state = self.logging_service.get_log_file_state()
+            logs, self._log_offset = self.logging_service.get_logs_tail_with_offset(
+                max_lines=MAX_LOG_LINES
+            )
+            # Oldest first, so new lines are appended at the bottom like a terminal
+            logs.reverse()
+            self._all_lines = deque(
+                filter(None, (line.rstrip('\n\r') for line in logs)),
+                maxlen=MAX_LOG_LINES
             )
+            self._render_lines()
         except Exception as e:
-            error_html = f'<span style="color: #f85149;">Error loading logs: {e}</span>'
-            self.logs_text.setHtml(f"""
-                <html>
-                <body style="background-color: #0d1117; color: #c9d1d9; font-family: 'Consolas', 'Courier New', 'Monaco', monospace; font-size: 12px;">
-                    {error_html}
-                </body>
-                </html>
-            """)
+            self._log_offset = None
+            self.logs_text.setPlainText(f"Error loading logs: {e}")
             self.status_label.setText(self.translator.t("admin.logs.error_loading"))
     
+    def _render_lines(self):
+        """Show the in-memory log lines that match the current search."""
+        pattern = self._get_search_pattern()
+        lines = self._all_lines if pattern is None else list(filter(pattern.search, self._all_lines))
+        
+        follow = self._is_following_tail()
+        
+        # Set plain text; colors are applied by the highlighter
+        self.logs_text.setPlainText('\n'.join(lines))
+        
+        if follow:
+            self.logs_text.moveCursor(QTextCursor.MoveOperation.End)
+        
+        self._line_count = len(lines)
+        self._update_status()
+    
+    def _append_lines(self, lines):
+        """Append log lines to the end of the view in a single edit block."""
+        if not lines:
+            return
+        
+        follow = self._is_following_tail()
+        
+        # One edit block so the document is laid out once for the whole batch
+        cursor = QTextCursor(self.logs_text.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for line in lines:
+            if not cursor.atStart():
+                cursor.insertBlock()
+            cursor.insertText(line)
+        cursor.endEditBlock()
+        
+        if follow:
+            self.logs_text.moveCursor(QTextCursor.MoveOperation.End)
+        
+        self._line_count = min(self._line_count + len(lines), MAX_LOG_LINES)
+        self._update_status()
+    
+    def _is_following_tail(self) -> bool:
+        """Check whether new lines should keep the view scrolled to the end.
+        
+        QPlainTextEdit's scroll range counts lines, so this does not force a
+        document layout.
+        """
+        if not self.auto_refresh:
+            return False
+        scrollbar = self.logs_text.verticalScrollBar()
+        return scrollbar.value() >= scrollbar.maximum() - 1
+    
+    def _update_status(self):
+        """Update the line count status label."""
+        self.status_label.setText(
+            self._status_fmt.format(count=self._line_count)
+        )
+    
+    def _get_search_pattern(self):
+        """Return the compiled search pattern, rebuilding it only when the term changes."""
+        search_term = self.search_input.text().strip().lower()
+        if search_term != self._current_search:
+            self._current_search = search_term
+            self._search_pattern = (
+                re.compile(re.escape(search_term), re.IGNORECASE) if search_term else None
+            )
+        return self._search_pattern
+    
+    def showEvent(self, event):
+        """Load logs on first show and resume auto-refresh."""
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            self.load_logs()
+        else:
+            self.refresh_if_changed()
+        if self.auto_refresh:
+            self.refresh_timer.start(self._refresh_interval())
+    
+    def hideEvent(self, event):
+        """Stop auto-refresh while the tab is not visible."""
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+    
+    def changeEvent(self, event):
+        """Adjust the auto-refresh interval when the window (de)activates."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.ActivationChange:
+            self._idle_ticks = 0
+            self._update_refresh_interval()
+            if self.isActiveWindow() and self.refresh_timer.isActive():
+                self.refresh_if_changed()
+    
+    def _refresh_interval(self) -> int:
+        """Get the auto-refresh interval for the current activity state."""
+        base = REFRESH_INTERVAL_MS if self.isActiveWindow() else INACTIVE_REFRESH_INTERVAL_MS
+        return min(base << min(self._idle_ticks, 4), MAX_REFRESH_INTERVAL_MS)
+    
+    def _update_refresh_interval(self):
+        """Apply the current auto-refresh interval to the timer."""
+        interval = self._refresh_interval()
+        if self.refresh_timer.interval() != interval:
+            self.refresh_timer.setInterval(interval)
+    
     def on_search_changed(self, text):
         """Handle search text change."""
-        self.load_logs()
+        # Re-filter the lines already in memory instead of re-reading the file
+        if self._loaded:
+            self._render_lines()
     
     def on_auto_refresh_toggled(self, checked):
         """Handle auto-refresh toggle."""
         self.auto_refresh = checked
         if checked:
-            self.refresh_timer.start(2000)
+            if self.isVisible():
+                self.refresh_timer.start(self._refresh_interval())
             self.auto_refresh_button.setText("  " + self.translator.t("admin.logs.auto_refresh"))
         else:
             self.refresh_timer.stop()
@@ -268,6 +407,7 @@ class LogsTab(QWidget):
     
     def refresh_ui(self):
         """Refresh UI after language change."""
+        self._status_fmt = self.translator.t("admin.logs.status")
         self.title_label.setText(self.translator.t("admin.logs.title"))
         self.description_label.setText(self.translator.t("admin.logs.description"))
         self.search_input.setPlaceholderText(self.translator.t("admin.logs.search_placeholder"))
@@ -279,5 +419,6 @@ class LogsTab(QWidget):
         else:
             self.auto_refresh_button.setText("  " + self.translator.t("admin.logs.auto_refresh_off"))
         self.logs_text.setPlaceholderText(self.translator.t("admin.logs.no_logs"))
-        self.load_logs()
+        if self._loaded:
+            self.load_logs()
 
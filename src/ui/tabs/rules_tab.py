@@ -14,6 +14,8 @@ class RulesTab(QWidget):
         super().__init__(parent)
         self.config_store = config_store
         self.translator = translator
+        # Admin status cannot change during the process lifetime
+        self._is_admin = self._probe_admin()
         self.init_ui()
     
     def init_ui(self):
@@ -49,10 +51,10 @@ class RulesTab(QWidget):
         card_layout.addWidget(self.admin_checkbox)
         
         # Description
-        desc_label = QLabel(self.translator.t("admin.rules.run_as_admin_desc"))
-        desc_label.setStyleSheet("color: #a0a0a0; font-size: 12px; padding-left: 30px;")
-        desc_label.setWordWrap(True)
-        card_layout.addWidget(desc_label)
+        self.desc_label = QLabel(self.translator.t("admin.rules.run_as_admin_desc"))
+        self.desc_label.setStyleSheet("color: #a0a0a0; font-size: 12px; padding-left: 30px;")
+        self.desc_label.setWordWrap(True)
+        card_layout.addWidget(self.desc_label)
         
         layout.addWidget(card)
         
@@ -67,6 +69,11 @@ class RulesTab(QWidget):
     
     def is_running_as_admin(self) -> bool:
         """Check if the application is running with administrator privileges."""
+        return self._is_admin
+    
+    @staticmethod
+    def _probe_admin() -> bool:
+        """Query Windows for administrator privileges."""
         try:
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
         except:
@@ -166,13 +173,7 @@ class RulesTab(QWidget):
         """Refresh UI after language change."""
         self.title_label.setText(self.translator.t("admin.rules.title"))
         self.admin_checkbox.setText(self.translator.t("admin.rules.run_as_admin"))
-        
-        # Find and update description label
-        card = self.findChild(QWidget)
-        if card:
-            labels = card.findChildren(QLabel)
-            if len(labels) > 0:
-                labels[0].setText(self.translator.t("admin.rules.run_as_admin_desc"))
+        self.desc_label.setText(self.translator.t("admin.rules.run_as_admin_desc"))
         
         self.update_status_label()
 
@@ -1,21 +1,122 @@
 """Settings tab for configuring startup trigger."""
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox,
-    QComboBox, QPushButton, QMessageBox
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox,
+    QComboBox, QPushButton
 )
-from PySide6.QtCore import Qt, QTimer
-import qtawesome as qta
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QSignalBlocker, QThreadPool, Signal
+import ctypes
+import logging
+import random
 import time
+import traceback
 
 from services.launcher_service import LauncherService
 from services.startup_service import StartupService
 from services.logging_service import get_logging_service
+from ui.icons import get_icon
 from models.config_models import StarterSettings
 
 
+# CoInitializeEx flags: COINIT_APARTMENTTHREADED | COINIT_DISABLE_OLE1DDE
+_COINIT_FLAGS = 0x2 | 0x4
+
+# At most this many favourites launch at once; each worker waits a jittered
+# delay of up to twice _LAUNCH_STAGGER_S first so launches don't start in lockstep
+MAX_CONCURRENT_LAUNCHES = 3
+_LAUNCH_STAGGER_S = 0.5
+
+# Launch delay choices (seconds) and their combo box indices
+DELAY_OPTIONS = ("1", "2", "3", "4", "5", "10", "15", "20")
+_DELAY_INDEX = {value: i for i, value in enumerate(DELAY_OPTIONS)}
+
+# Locale-independent stylesheets, built once
+_STYLE_TITLE = "font-size: 18px; font-weight: 600;"
+_STYLE_DESCRIPTION = "font-size: 13px; color: #a0a0a0; margin-top: 8px;"
+_STYLE_AUTOSTART_BASE = "font-size: 12px; padding: 10px; border-radius: 6px; margin-bottom: 10px;"
+_STYLE_AUTOSTART_OK = (
+    _STYLE_AUTOSTART_BASE +
+    " background-color: rgba(25, 135, 84, 0.15); color: #198754; border: 1px solid rgba(25, 135, 84, 0.3);"
+)
+_STYLE_AUTOSTART_WARN = (
+    _STYLE_AUTOSTART_BASE +
+    " background-color: rgba(255, 193, 7, 0.15); color: #ffc107; border: 1px solid rgba(255, 193, 7, 0.3);"
+)
+_STYLE_TOAST = (
+    "font-size: 12px; padding: 8px; border-radius: 6px; margin-top: 10px; "
+    "background-color: rgba(25, 135, 84, 0.15); color: #198754; border: 1px solid rgba(25, 135, 84, 0.3);"
+)
+
+
+class LaunchSignals(QObject):
+    """Signals emitted by LaunchWorker."""
+    
+    finished = Signal(str, bool)  # name, success
+    failed = Signal(str, str)  # name, formatted traceback
+
+
+class LaunchWorker(QRunnable):
+    """Runnable that launches a single favourite off the GUI thread."""
+    
+    def __init__(self, launcher, favourite):
+        super().__init__()
+        self.launcher = launcher
+        self.favourite = favourite
+        self.signals = LaunchSignals()
+    
+    def run(self):
+        """Launch the favourite in the thread pool."""
+        time.sleep(random.uniform(0, 2 * _LAUNCH_STAGGER_S))
+        
+        # ShellExecute may hand off to shell extensions, which need COM on this thread
+        try:
+            com_initialized = ctypes.windll.ole32.CoInitializeEx(None, _COINIT_FLAGS) >= 0
+        except AttributeError:
+            com_initialized = False
+        
+        try:
+            success = self.launcher.test_favourite(self.favourite)
+        except Exception:
+            self.signals.failed.emit(self.favourite.name, traceback.format_exc())
+        else:
+            self.signals.finished.emit(self.favourite.name, bool(success))
+        finally:
+            if com_initialized:
+                ctypes.windll.ole32.CoUninitialize()
+
+
+class _IsEnabledSignals(QObject):
+    """Signals emitted by _IsEnabledWorker."""
+    
+    finished = Signal(int, bool)  # query generation, autostart enabled
+
+
+class _IsEnabledWorker(QRunnable):
+    """Runnable that queries the autostart task off the GUI thread."""
+    
+    def __init__(self, startup_service, generation):
+        super().__init__()
+        self.startup_service = startup_service
+        self.generation = generation
+        self.signals = _IsEnabledSignals()
+    
+    def run(self):
+        """Run the Task Scheduler query in the thread pool."""
+        self.signals.finished.emit(self.generation, bool(self.startup_service.is_enabled()))
+
+
 class SettingsTab(QWidget):
     """Settings tab with trigger and delay options."""
     
+    # Translation keys resolved once per language into self._strings
+    _STRING_KEYS = (
+        "starter_settings.title",
+        "starter_settings.description",
+        "starter_settings.trigger_selected",
+        "starter_settings.delay_seconds",
+        "starter_settings.save",
+        "common.messages.saved",
+    )
+    
     def __init__(self, config_store, translator, parent=None, is_startup_launch=False):
         super().__init__(parent)
         self.config_store = config_store
@@ -23,14 +124,60 @@ class SettingsTab(QWidget):
         self.launcher = LauncherService()
         self.startup_service = StartupService()
         self.logging_service = get_logging_service()
+        self._launch_pool = QThreadPool(self)
+        self._launch_pool.setMaxThreadCount(MAX_CONCURRENT_LAUNCHES)
+        self._pending_launch = []
         self.startup_processed = False
         self.is_startup_launch = is_startup_launch
+        self._autostart_enabled_cache = None
+        # Bumped whenever autostart changes; results of older queries are
+        # dropped. _autostart_query_generation is that of the query in flight
+        self._autostart_generation = 0
+        self._autostart_query_generation = None
+        # Set while the startup check's autostart status is still to be logged
+        self._autostart_log_pending = False
+        self._migration_done = False
+        self._strings = {}
+        self._load_strings()
+        
+        # Coalesce rapid settings changes into a single config write
+        self._pending_settings = None
+        self._settings_flush_timer = QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.timeout.connect(self._flush_settings)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_settings)
+        
+        # Startup delays don't need millisecond precision; coarse timers let
+        # the OS batch the wakeups
+        self._startup_check_timer = QTimer(self)
+        self._startup_check_timer.setSingleShot(True)
+        self._startup_check_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._startup_check_timer.timeout.connect(self.check_startup_trigger)
+        self._launch_timer = QTimer(self)
+        self._launch_timer.setSingleShot(True)
+        self._launch_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._launch_timer.timeout.connect(self._launch_pending_favourites)
+        
         self.init_ui()
         self.load_settings()
+    
+    def start_startup_check(self):
+        """Schedule the startup trigger check.
         
-        # Check if we should trigger on startup (delayed)
-        # Only trigger if app was started from Windows boot, not manually
-        QTimer.singleShot(1000, self.check_startup_trigger)
+        Called once the main window has been shown, so the delay starts
+        after the UI is visible rather than during construction. The
+        autostart query starts now so its result is usually in by the time
+        the check logs it.
+        """
+        if self.is_startup_launch and self._autostart_enabled_cache is None:
+            self._query_autostart_status()
+        self._startup_check_timer.start(1000)
+    
+    def _load_strings(self):
+        """Resolve this tab's translation keys for the current language."""
+        self._strings = {key: self.translator.t(key) for key in self._STRING_KEYS}
     
     def init_ui(self):
         """Initialize tab UI."""
@@ -38,14 +185,14 @@ class SettingsTab(QWidget):
         layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         
         # Title
-        self.title_label = QLabel(self.translator.t("starter_settings.title"))
-        self.title_label.setStyleSheet("font-size: 18px; font-weight: 600;")
+        self.title_label = QLabel(self._strings["starter_settings.title"])
+        self.title_label.setStyleSheet(_STYLE_TITLE)
         layout.addWidget(self.title_label)
         
         # Description
-        self.description_label = QLabel(self.translator.t("starter_settings.description"))
+        self.description_label = QLabel(self._strings["starter_settings.description"])
         self.description_label.setWordWrap(True)
-        self.description_label.setStyleSheet("font-size: 13px; color: #a0a0a0; margin-top: 8px;")
+        self.description_label.setStyleSheet(_STYLE_DESCRIPTION)
         layout.addWidget(self.description_label)
         
         layout.addSpacing(20)
@@ -59,7 +206,6 @@ class SettingsTab(QWidget):
         # Autostart status info
         self.autostart_status_label = QLabel()
         self.autostart_status_label.setWordWrap(True)
-        self.autostart_status_label.setStyleSheet("font-size: 12px; padding: 10px; border-radius: 6px; margin-bottom: 10px;")
         self.update_autostart_status()
         card_layout.addWidget(self.autostart_status_label)
         
@@ -67,7 +213,7 @@ class SettingsTab(QWidget):
         
         # Trigger toggle
         self.trigger_checkbox = QCheckBox(
-            self.translator.t("starter_settings.trigger_selected")
+            self._strings["starter_settings.trigger_selected"]
         )
         self.trigger_checkbox.stateChanged.connect(self.on_trigger_changed)
         card_layout.addWidget(self.trigger_checkbox)
@@ -76,12 +222,13 @@ class SettingsTab(QWidget):
         
         # Delay dropdown
         delay_layout = QHBoxLayout()
-        delay_label = QLabel(self.translator.t("starter_settings.delay_seconds"))
-        delay_layout.addWidget(delay_label)
+        self.delay_label = QLabel(self._strings["starter_settings.delay_seconds"])
+        delay_layout.addWidget(self.delay_label)
         
         self.delay_combo = QComboBox()
-        self.delay_combo.addItems(["1", "2", "3", "4", "5", "10", "15", "20"])
+        self.delay_combo.addItems(DELAY_OPTIONS)
         self.delay_combo.setMaximumWidth(100)
+        self.delay_combo.currentIndexChanged.connect(self._on_delay_changed)
         delay_layout.addWidget(self.delay_combo)
         delay_layout.addStretch()
         
@@ -90,16 +237,35 @@ class SettingsTab(QWidget):
         card_layout.addSpacing(20)
         
         # Save button with icon
-        self.save_button = QPushButton("  " + self.translator.t("starter_settings.save"))
-        self.save_button.setIcon(qta.icon('fa5s.save', color='white'))
+        # Icon is set on first show to keep qtawesome rendering off construction
+        self.save_button = QPushButton("  " + self._strings["starter_settings.save"])
         self.save_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.save_button.clicked.connect(self.on_save)
         self.save_button.setMaximumWidth(150)
         card_layout.addWidget(self.save_button)
         
+        # Non-modal "saved" notice, shown briefly after an explicit save
+        self._toast_label = QLabel()
+        self._toast_label.setStyleSheet(_STYLE_TOAST)
+        self._toast_label.hide()
+        card_layout.addWidget(self._toast_label)
+        
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._toast_timer.timeout.connect(self._toast_label.hide)
+        
         layout.addWidget(card)
         layout.addStretch()
     
+    def showEvent(self, event):
+        """Create the save button icon and query autostart status on show."""
+        super().showEvent(event)
+        if self.save_button.icon().isNull():
+            self.save_button.setIcon(get_icon('fa5s.save'))
+        if self._autostart_enabled_cache is None:
+            self._query_autostart_status()
+    
     def load_settings(self):
         """Load settings from config."""
         settings = self.config_store.get_starter_settings()
@@ -109,180 +275,238 @@ class SettingsTab(QWidget):
         if not settings.trigger_selected_on_startup:
             settings.trigger_selected_on_startup = True
             self.config_store.update_starter_settings(settings)
+        self._migration_done = True
         
-        # Always set checkbox to True (default behavior)
-        self.trigger_checkbox.setChecked(True)
-        
-        # Set delay combo
-        delay_str = str(settings.delay_seconds)
-        index = self.delay_combo.findText(delay_str)
-        if index >= 0:
-            self.delay_combo.setCurrentIndex(index)
-        else:
-            # Default to 1 second if not found
-            index = self.delay_combo.findText("1")
-            if index >= 0:
-                self.delay_combo.setCurrentIndex(index)
+        # Always set checkbox to True (default behavior); the value is already
+        # persisted above, so don't let on_trigger_changed write it again
+        with QSignalBlocker(self.trigger_checkbox):
+            self.trigger_checkbox.setChecked(True)
         
-        # Update autostart status
+        # Set delay combo (default to 1 second if not found)
+        index = _DELAY_INDEX.get(str(settings.delay_seconds), _DELAY_INDEX["1"])
+        self.delay_combo.setCurrentIndex(index)
+        self._delay_seconds = int(self.delay_combo.currentText())
+    
+    def _on_delay_changed(self, index):
+        """Cache the selected delay so save paths don't re-parse the combo text."""
+        self._delay_seconds = int(self.delay_combo.itemText(index))
+    
+    def invalidate_autostart_cache(self):
+        """Forget the cached autostart status and refresh the status label."""
+        self._autostart_generation += 1
+        self._autostart_enabled_cache = None
+        self.update_autostart_status()
+        if self.isVisible() or self._autostart_log_pending:
+            self._query_autostart_status()
+    
+    def _query_autostart_status(self):
+        """Query the autostart status in the thread pool, unless an up-to-date query is running."""
+        if self._autostart_query_generation == self._autostart_generation:
+            return
+        self._autostart_query_generation = self._autostart_generation
+        worker = _IsEnabledWorker(self.startup_service, self._autostart_generation)
+        worker.signals.finished.connect(
+            self._apply_autostart_status, Qt.ConnectionType.QueuedConnection
+        )
+        QThreadPool.globalInstance().start(worker)
+    
+    def _apply_autostart_status(self, generation, enabled):
+        """Cache the autostart status reported by the worker and show it."""
+        if generation != self._autostart_generation:
+            # Autostart changed after this query started; the result is stale
+            return
+        self._autostart_query_generation = None
+        self._autostart_enabled_cache = enabled
         self.update_autostart_status()
+        if self._autostart_log_pending:
+            self._autostart_log_pending = False
+            self._log_autostart_status(enabled)
+    
+    def _log_autostart_status(self, enabled):
+        """Log the autostart status for the startup check."""
+        self.logging_service.info(f"Autostart enabled: {enabled}")
+        if not enabled:
+            self.logging_service.warning("Autostart is not enabled! Please enable it in Admin Settings → Settings")
     
     def update_autostart_status(self):
-        """Update autostart status label."""
-        autostart_enabled = self.startup_service.is_enabled()
+        """Update autostart status label from the cached status."""
+        autostart_enabled = self._autostart_enabled_cache
         
-        if autostart_enabled:
+        if autostart_enabled is None:
+            self.autostart_status_label.setText("Checking autostart status…")
+            self.autostart_status_label.setStyleSheet(_STYLE_AUTOSTART_BASE)
+        elif autostart_enabled:
             self.autostart_status_label.setText(
                 "✓ Autostart is enabled. The app will launch when Windows starts.\n"
                 "Selected favourites will be launched automatically after the delay."
             )
-            self.autostart_status_label.setStyleSheet(
-                "font-size: 12px; padding: 10px; border-radius: 6px; margin-bottom: 10px; "
-                "background-color: rgba(25, 135, 84, 0.15); color: #198754; border: 1px solid rgba(25, 135, 84, 0.3);"
-            )
+            self.autostart_status_label.setStyleSheet(_STYLE_AUTOSTART_OK)
         else:
             self.autostart_status_label.setText(
                 "⚠ Autostart is not enabled!\n"
                 "To enable auto-launch of favourites on Windows startup, please go to:\n"
                 "Admin Settings → Settings → Enable 'Always start this app when Windows starts'"
             )
-            self.autostart_status_label.setStyleSheet(
-                "font-size: 12px; padding: 10px; border-radius: 6px; margin-bottom: 10px; "
-                "background-color: rgba(255, 193, 7, 0.15); color: #ffc107; border: 1px solid rgba(255, 193, 7, 0.3);"
-            )
+            self.autostart_status_label.setStyleSheet(_STYLE_AUTOSTART_WARN)
     
     def on_trigger_changed(self, state):
-        """Handle trigger checkbox change - auto-save."""
-        settings = StarterSettings(
-            trigger_selected_on_startup=(state == Qt.CheckState.Checked),
-            delay_seconds=int(self.delay_combo.currentText())
-        )
-        self.config_store.update_starter_settings(settings)
+        """Handle trigger checkbox change - auto-save (debounced)."""
+        self._persist_settings(state == Qt.CheckState.Checked.value)
     
     def on_save(self):
         """Handle save button click."""
-        settings = StarterSettings(
-            trigger_selected_on_startup=self.trigger_checkbox.isChecked(),
-            delay_seconds=int(self.delay_combo.currentText())
-        )
-        
-        self.config_store.update_starter_settings(settings)
-        
-        QMessageBox.information(
-            self,
-            "Saved",
-            self.translator.t("common.messages.saved")
+        # Explicit save writes right away, replacing any pending auto-save
+        self._persist_settings(self.trigger_checkbox.isChecked(), immediate=True)
+        
+        # Don't block the event loop with a modal dialog; pending startup
+        # launches are driven by QTimer
+        self._toast_label.setText(self._strings["common.messages.saved"])
+        self._toast_label.show()
+        self._toast_timer.start(2000)
+    
+    def _persist_settings(self, trigger_selected: bool, immediate: bool = False):
+        """Queue the current settings for writing, flushing now if immediate."""
+        self._pending_settings = StarterSettings(
+            trigger_selected_on_startup=trigger_selected,
+            delay_seconds=self._delay_seconds
         )
+        if immediate:
+            self._flush_settings()
+        else:
+            self._settings_flush_timer.start(500)
     
-    def _is_windows_boot_recent(self) -> bool:
-        """
-        Check if app was started from Windows boot (not manually).
-        
-        Returns:
-            True if app was started from Windows boot, False otherwise
-        """
-        # Check if app was started with --startup argument
-        if self.is_startup_launch:
-            self.logging_service.info("App was started from Windows boot (--startup argument detected)")
-            return True
-        
-        self.logging_service.info("App was not started from Windows boot (no --startup argument)")
-        return False
+    def _flush_settings(self):
+        """Write pending settings to the config store, if any."""
+        self._settings_flush_timer.stop()
+        if self._pending_settings is None:
+            return
+        settings, self._pending_settings = self._pending_settings, None
+        self.config_store.update_starter_settings(settings)
     
     def check_startup_trigger(self):
         """Check if we should launch selected favourites on startup.
         Only triggers if app was started from Windows boot, not manually opened.
-        """
-        self.logging_service.info("=" * 60)
-        self.logging_service.info("check_startup_trigger() called")
-        self.logging_service.info("=" * 60)
         
+        Progress is collected into log_lines and written as a single record
+        once a decision has been made.
+        """
         if self.startup_processed:
             self.logging_service.info("Startup already processed, skipping...")
             return
         
-        # Check if autostart is enabled
-        autostart_enabled = self.startup_service.is_enabled()
-        self.logging_service.info(f"Autostart enabled: {autostart_enabled}")
-        
-        if not autostart_enabled:
-            self.logging_service.warning("Autostart is not enabled! Please enable it in Admin Settings → Settings")
-        
-        # Check if app was started from Windows boot (not manually)
-        if not self._is_windows_boot_recent():
-            self.logging_service.info("App was not started from Windows boot, skipping auto-launch...")
+        # Manual launches never auto-launch, so skip all the work below
+        if not self.is_startup_launch:
+            self.logging_service.debug("App was not started from Windows boot (no --startup argument), skipping auto-launch")
             return
         
+        log_lines = [
+            "=" * 60,
+            "check_startup_trigger() called",
+            "=" * 60,
+            "App was started from Windows boot (--startup argument detected)",
+        ]
+        
+        # The autostart status only feeds the log, so never wait for (or run)
+        # the Task Scheduler query here; if it hasn't reported yet,
+        # _apply_autostart_status logs it when it does
+        autostart_enabled = self._autostart_enabled_cache
+        if autostart_enabled is None:
+            log_lines.append("Autostart enabled: still checking, logged once known")
+            self._autostart_log_pending = True
+            self._query_autostart_status()
+        else:
+            self._log_autostart_status(autostart_enabled)
+        
         # Get settings and ensure trigger is enabled (migrate old configs)
         settings = self.config_store.get_starter_settings()
-        self.logging_service.info(f"trigger_selected_on_startup (before migration): {settings.trigger_selected_on_startup}")
+        log_lines.append(f"trigger_selected_on_startup (before migration): {settings.trigger_selected_on_startup}")
         
-        # Force enable trigger if it's False (migrate old configs)
-        if not settings.trigger_selected_on_startup:
-            self.logging_service.info("Migrating trigger_selected_on_startup from False to True...")
+        # Force enable trigger if it's False (migrate old configs), unless
+        # load_settings already did
+        if not self._migration_done and not settings.trigger_selected_on_startup:
             settings.trigger_selected_on_startup = True
             self.config_store.update_starter_settings(settings)
-            self.logging_service.info("Migration complete: trigger_selected_on_startup is now True")
+            log_lines.append("Migrated trigger_selected_on_startup from False to True")
         
-        self.logging_service.info(f"trigger_selected_on_startup (after migration): {settings.trigger_selected_on_startup}")
-        self.logging_service.info(f"delay_seconds: {settings.delay_seconds}")
+        log_lines.append(f"trigger_selected_on_startup (after migration): {settings.trigger_selected_on_startup}")
+        log_lines.append(f"delay_seconds: {settings.delay_seconds}")
         
-        # Double-check after migration
-        settings = self.config_store.get_starter_settings()
         if not settings.trigger_selected_on_startup:
+            self.logging_service.info("\n".join(log_lines))
             self.logging_service.warning("Trigger is still disabled after migration, skipping...")
             return
         
         self.startup_processed = True
         
         # Get selected favourites
-        favourites = self.config_store.get_favourites()
-        self.logging_service.info(f"Total favourites: {len(favourites)}")
-        selected_favourites = [f for f in favourites if f.selected]
-        self.logging_service.info(f"Selected favourites: {len(selected_favourites)}")
-        
-        for fav in selected_favourites:
-            self.logging_service.info(f"  - {fav.name} (kind: {fav.kind}, selected: {fav.selected}, lnk_path: {fav.lnk_path})")
+        selected_favourites = list(self.config_store.get_selected_favourites())
+        log_lines.append(f"Selected favourites: {len(selected_favourites)}")
         
         if not selected_favourites:
+            self.logging_service.info("\n".join(log_lines))
             self.logging_service.warning("No selected favourites, skipping...")
             return
         
         # Wait for delay
         delay = settings.delay_seconds
-        self.logging_service.info(f"Scheduling launch after {delay} seconds...")
+        log_lines.append(f"Scheduling launch after {delay} seconds...")
+        self.logging_service.info("\n".join(log_lines))
+        
+        if self.logging_service.is_enabled_for(logging.DEBUG):
+            for fav in selected_favourites:
+                self.logging_service.debug(f"  - {fav.name} (kind: {fav.kind}, selected: {fav.selected}, lnk_path: {fav.lnk_path})")
         
         # Use QTimer for non-blocking delay
-        QTimer.singleShot(delay * 1000, lambda: self.launch_favourites(selected_favourites))
+        self._pending_launch = selected_favourites
+        self._launch_timer.start(delay * 1000)
+    
+    def _launch_pending_favourites(self):
+        """Launch the favourites scheduled by check_startup_trigger."""
+        favourites, self._pending_launch = self._pending_launch, []
+        self.launch_favourites(favourites)
     
     def launch_favourites(self, favourites):
-        """Launch selected favourites."""
+        """Launch selected favourites.
+        
+        All launches are queued at once on a bounded thread pool, so at most
+        MAX_CONCURRENT_LAUNCHES run together and the GUI thread never waits.
+        """
         self.logging_service.info(f"Starting to launch {len(favourites)} favourites...")
-        for i, fav in enumerate(favourites):
-            try:
-                self.logging_service.info(f"[{i+1}/{len(favourites)}] Launching {fav.name} (kind: {fav.kind}, selected: {fav.selected})...")
-                self.logging_service.info(f"  lnk_path: {fav.lnk_path}")
-                
-                success = self.launcher.test_favourite(fav)
-                if not success:
-                    self.logging_service.error(f"  ❌ Failed to launch {fav.name}")
-                else:
-                    self.logging_service.info(f"  ✅ Successfully launched {fav.name}")
-                
-                # Delay between launches to avoid overwhelming the system
-                # Longer delay for startup to ensure apps have time to initialize
-                if i < len(favourites) - 1:  # Don't delay after the last one
-                    self.logging_service.info(f"  Waiting 1.5 seconds before next launch...")
-                    time.sleep(1.5)  # Increased delay for startup
-            except Exception as e:
-                self.logging_service.error(f"  ❌ Error launching {fav.name}: {e}", exc_info=True)
-        
-        self.logging_service.info(f"Finished launching favourites.")
+        if not favourites:
+            return
+        
+        log_debug = self.logging_service.is_enabled_for(logging.DEBUG)
+        log_lines = []
+        for index, fav in enumerate(favourites, start=1):
+            log_lines.append(f"[{index}/{len(favourites)}] Launching {fav.name} (kind: {fav.kind}, selected: {fav.selected})...")
+            if log_debug:
+                self.logging_service.debug(f"  {fav.name} lnk_path: {fav.lnk_path}")
+            
+            worker = LaunchWorker(self.launcher, fav)
+            worker.signals.finished.connect(self.on_launch_finished)
+            worker.signals.failed.connect(self.on_launch_failed)
+            self._launch_pool.start(worker)
+        
+        log_lines.append("All favourites dispatched for launch.")
+        self.logging_service.info("\n".join(log_lines))
+    
+    def on_launch_finished(self, name, success):
+        """Log the result of a background favourite launch."""
+        if not success:
+            self.logging_service.error(f"  ❌ Failed to launch {name}")
+        else:
+            self.logging_service.info(f"  ✅ Successfully launched {name}")
+    
+    def on_launch_failed(self, name, error):
+        """Log an exception raised by a background favourite launch."""
+        self.logging_service.error(f"  ❌ Error launching {name}:\n{error}")
     
     def refresh_ui(self):
         """Refresh UI after language change."""
-        self.title_label.setText(self.translator.t("starter_settings.title"))
-        self.description_label.setText(self.translator.t("starter_settings.description"))
-        self.trigger_checkbox.setText(self.translator.t("starter_settings.trigger_selected"))
-        self.save_button.setText("  " + self.translator.t("starter_settings.save"))
+        self._load_strings()
+        self.title_label.setText(self._strings["starter_settings.title"])
+        self.description_label.setText(self._strings["starter_settings.description"])
+        self.trigger_checkbox.setText(self._strings["starter_settings.trigger_selected"])
+        self.delay_label.setText(self._strings["starter_settings.delay_seconds"])
+        self.save_button.setText("  " + self._strings["starter_settings.save"])
 
@@ -1,51 +1,100 @@
 """Startup Status tab showing apps that start with Windows."""
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QMessageBox
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QMessageBox, QTableView, QHeaderView, QStyledItemDelegate,
+    QStyle, QAbstractItemView, QToolTip, QFrame,
+    QGraphicsScene, QGraphicsView, QGraphicsPixmapItem
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSize
-from PySide6.QtGui import QTransform, QPixmap, QPainter, QFontMetrics
-import qtawesome as qta
+from PySide6.QtCore import (
+    Qt, QObject, QThread, Signal, Slot, QTimer, QSize, QRect, QEvent,
+    QAbstractTableModel, QModelIndex, QVariantAnimation
+)
+from PySide6.QtGui import QColor, QPalette
+from functools import lru_cache
 
 from services.startup_monitor_service import StartupMonitorService, StartupAppInfo
+from ui.icons import get_icon, get_pixmap
 
 
-class ElidedLabel(QLabel):
-    """QLabel that automatically elides text when it's too long."""
-    
-    def __init__(self, text="", parent=None):
-        super().__init__(text, parent)
-        self._full_text = text
-        self._elided_text = text
-    
-    def setText(self, text):
-        """Set text and store full text for tooltip."""
-        self._full_text = text
-        self.updateElidedText()
-    
-    def resizeEvent(self, event):
-        """Update elided text when widget is resized."""
-        super().resizeEvent(event)
-        self.updateElidedText()
-    
-    def updateElidedText(self):
-        """Update the displayed text with elision."""
-        if not self._full_text:
-            super().setText("")
-            return
-        
-        metrics = QFontMetrics(self.font())
-        available_width = self.width() - 10  # Leave some padding
-        self._elided_text = metrics.elidedText(
-            self._full_text,
-            Qt.TextElideMode.ElideRight,
-            available_width
-        )
-        super().setText(self._elided_text)
+# Stylesheets shared by every instance, built once
+_OVERLAY_STYLE = """
+    QWidget {
+        background-color: rgba(30, 30, 30, 200);
+    }
+"""
+_OVERLAY_TEXT_STYLE = "color: #e0e0e0; font-size: 16px; margin-top: 20px;"
+_TITLE_STYLE = "font-size: 18px; font-weight: 600;"
+_DESCRIPTION_STYLE = "font-size: 13px; color: #a0a0a0; margin-top: 8px;"
+_MUTED_STYLE = "color: #a0a0a0; font-size: 12px;"
+_NO_APPS_STYLE = "color: #a0a0a0; padding: 20px;"
+_APPS_VIEW_STYLE = """
+    QTableView {
+        background-color: transparent;
+        border: none;
+    }
+    QTableView::item {
+        padding: 0px 6px;
+        border: none;
+    }
+    QTableView::item:hover {
+        background-color: #2d2d2d;
+    }
+    QHeaderView::section {
+        background-color: #252525;
+        color: #e0e0e0;
+        font-weight: 600;
+        border: none;
+        padding: 8px 6px;
+    }
+"""
+
+# Source column tooltips for the sources StartupMonitorService reports
+_SOURCE_TOOLTIP = "Startup Source: {source}\nThis indicates where the startup entry is configured"
+_SOURCE_TOOLTIPS = {
+    source: _SOURCE_TOOLTIP.format(source=source) + suffix
+    for source, suffix in (
+        ("Registry (User)", "\n(Windows Registry)"),
+        ("Registry (System)", "\n(Windows Registry)"),
+        ("Startup Folder (User)", "\n(Startup Folder)"),
+        ("Startup Folder (All Users)", "\n(Startup Folder)"),
+        ("Task Scheduler", "\n(Task Scheduler)"),
+    )
+}
 
+# Status column presentation: status -> (color, text, tooltip template)
+_STATUS_DISPATCH = {
+    "running": ("#198754", "Running", "Status: Running\nProcess ID: {pid}"),
+    "stopped": ("#6c757d", "Stopped", "Status: Stopped\nApplication is not currently running"),
+}
+_STATUS_UNKNOWN = ("#ffc107", "Unknown", "Status: Unknown\nUnable to determine application status")
 
-class RefreshWorker(QThread):
-    """Worker thread for refreshing startup apps data."""
+# Pixmaps painted by the apps table, rendered ahead of the first refresh
+_TABLE_PIXMAPS = tuple(
+    ('fa5s.circle', color, 16)
+    for color, _text, _tooltip in (*_STATUS_DISPATCH.values(), _STATUS_UNKNOWN)
+) + (
+    ('fa5s.minus-circle', '#dc3545', 16),
+    ('fa5s.trash', '#dc3545', 16),
+)
+
+
+def _prewarm_table_pixmaps():
+    """Render the table's icons into the shared pixmap cache."""
+    for name, color, size in _TABLE_PIXMAPS:
+        get_pixmap(name, color, size)
+
+
+# Action column tooltips
+_KILL_TOOLTIP = "Kill Process\nTerminate the running process (PID: {pid})\nThis will stop the application immediately"
+_KILL_UNAVAILABLE_TOOLTIP = "Kill Process: Not available\nApplication is not currently running"
+_DELETE_TOOLTIP = (
+    "Remove from Startup\nPermanently remove '{name}' from Windows startup\nSource: {source}\n\n"
+    "This will prevent the app from starting automatically on boot"
+)
+
+
+class RefreshWorker(QObject):
+    """Worker living on a persistent background thread that refreshes startup apps data."""
     
     finished = Signal(list, dict)  # Signal with (apps, system_info)
     
@@ -53,7 +102,8 @@ class RefreshWorker(QThread):
         super().__init__()
         self.monitor_service = monitor_service
     
-    def run(self):
+    @Slot()
+    def do_refresh(self):
         """Run the refresh in background."""
         apps = self.monitor_service.get_startup_apps()
         system_info = self.monitor_service.get_system_info()
@@ -63,256 +113,430 @@ class RefreshWorker(QThread):
 class LoadingOverlay(QWidget):
     """Full-screen loading overlay with spinning icon."""
     
+    SPIN_DURATION_MS = 1200  # One full turn
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
-        self.rotation_angle = 0
         self.init_ui()
-        self.start_animation()
+        
+        # Rotate the scene item rather than re-rendering pixmaps; the
+        # animation only runs while the overlay is visible
+        self.animation = QVariantAnimation(self)
+        self.animation.setStartValue(0.0)
+        self.animation.setEndValue(360.0)
+        self.animation.setDuration(self.SPIN_DURATION_MS)
+        self.animation.setLoopCount(-1)
+        self.animation.valueChanged.connect(self.rotate_icon)
     
     def init_ui(self):
         """Initialize overlay UI."""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: rgba(30, 30, 30, 200);
-            }
-        """)
+        self.setStyleSheet(_OVERLAY_STYLE)
         
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        # Spinner icon
-        self.spinner_label = QLabel()
-        self.spinner_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.spinner_label.setFixedSize(64, 64)
-        layout.addWidget(self.spinner_label)
+        # Spinner icon, drawn once into a scene centered on the origin
+        base_pixmap = get_pixmap('fa5s.spinner', '#0d6efd', 48)
+        scene = QGraphicsScene(-32, -32, 64, 64, self)
+        self.spinner_item = QGraphicsPixmapItem(base_pixmap)
+        self.spinner_item.setOffset(-base_pixmap.width() / 2, -base_pixmap.height() / 2)
+        # Bilinear filtering isn't visible on a small icon spinning this fast
+        self.spinner_item.setTransformationMode(Qt.TransformationMode.FastTransformation)
+        scene.addItem(self.spinner_item)
+        
+        self.spinner_view = QGraphicsView(scene)
+        self.spinner_view.setFixedSize(64, 64)
+        self.spinner_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.spinner_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.spinner_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.spinner_view.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.spinner_view, 0, Qt.AlignmentFlag.AlignCenter)
         
         # Loading text
         text_label = QLabel("Loading...")
-        text_label.setStyleSheet("color: #e0e0e0; font-size: 16px; margin-top: 20px;")
+        text_label.setStyleSheet(_OVERLAY_TEXT_STYLE)
         text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(text_label)
-        
-        # Store base pixmap
-        icon = qta.icon('fa5s.spinner', color='#0d6efd')
-        self.base_pixmap = icon.pixmap(48, 48)
     
     def start_animation(self):
         """Start rotation animation."""
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.rotate_icon)
-        self.timer.start(50)  # Update every 50ms for smooth rotation
-    
-    def rotate_icon(self):
-        """Rotate icon by updating pixmap."""
-        self.rotation_angle = (self.rotation_angle + 15) % 360
-        
-        # Create transform and rotate
-        transform = QTransform()
-        transform.rotate(self.rotation_angle)
-        rotated_pixmap = self.base_pixmap.transformed(transform, Qt.TransformationMode.SmoothTransformation)
-        
-        # Center the rotated pixmap
-        final_pixmap = QPixmap(64, 64)
-        final_pixmap.fill(Qt.GlobalColor.transparent)
-        
-        p = QPainter(final_pixmap)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.drawPixmap(
-            (64 - rotated_pixmap.width()) // 2,
-            (64 - rotated_pixmap.height()) // 2,
-            rotated_pixmap
-        )
-        p.end()
-        
-        self.spinner_label.setPixmap(final_pixmap)
+        self.animation.start()
+    
+    def stop_animation(self):
+        """Stop rotation animation."""
+        self.animation.stop()
+    
+    def showEvent(self, event):
+        """Resume the animation when the overlay is shown."""
+        super().showEvent(event)
+        self.start_animation()
+    
+    def hideEvent(self, event):
+        """Pause the animation while the overlay is hidden."""
+        super().hideEvent(event)
+        self.stop_animation()
+    
+    def rotate_icon(self, angle):
+        """Rotate the spinner item to the animation's current angle."""
+        # A minimized window keeps its children "visible"; skip the repaint
+        if not self.isVisible() or self.window().isMinimized():
+            return
+        self.spinner_item.setRotation(angle)
 
 
-class StartupAppItemWidget(QWidget):
-    """Widget for a single startup app item with aligned columns."""
+class StartupAppsModel(QAbstractTableModel):
+    """Table model exposing StartupAppInfo entries to a QTableView."""
     
-    def __init__(self, app_info: StartupAppInfo, on_kill_callback, on_delete_callback, parent=None):
+    COLUMNS = ("Status", "Application Name", "Source", "PID", "Memory", "Action")
+    COLUMN_STRETCH = (1, 2, 1, 1, 1, 1)  # Relative column widths
+    STATUS_COLUMN, NAME_COLUMN, SOURCE_COLUMN, PID_COLUMN, MEMORY_COLUMN, ACTION_COLUMN = range(6)
+    
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.app_info = app_info
-        self.on_kill_callback = on_kill_callback
-        self.on_delete_callback = on_delete_callback
-        self.init_ui()
+        self._apps = []
     
-    def init_ui(self):
-        """Initialize item UI with aligned columns."""
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(10)
-        
-        # Status indicator (equal width)
-        status_widget = QWidget()
-        status_layout = QHBoxLayout(status_widget)
-        status_layout.setContentsMargins(0, 0, 0, 0)
-        status_layout.setSpacing(5)
-        
-        status_icon = QLabel()
-        if self.app_info.status == "running":
-            status_icon.setPixmap(qta.icon('fa5s.circle', color='#198754').pixmap(16, 16))
-            status_text = "Running"
-            status_color = "#198754"
-            status_tooltip = f"Status: Running\nProcess ID: {self.app_info.process_id if self.app_info.process_id else 'N/A'}"
-        elif self.app_info.status == "stopped":
-            status_icon.setPixmap(qta.icon('fa5s.circle', color='#6c757d').pixmap(16, 16))
-            status_text = "Stopped"
-            status_color = "#6c757d"
-            status_tooltip = "Status: Stopped\nApplication is not currently running"
-        else:
-            status_icon.setPixmap(qta.icon('fa5s.circle', color='#ffc107').pixmap(16, 16))
-            status_text = "Unknown"
-            status_color = "#ffc107"
-            status_tooltip = "Status: Unknown\nUnable to determine application status"
-        
-        status_icon.setToolTip(status_tooltip)
-        status_layout.addWidget(status_icon)
-        status_label = QLabel(status_text)
-        status_label.setStyleSheet(f"color: {status_color}; font-weight: 500;")
-        status_label.setToolTip(status_tooltip)
-        status_layout.addWidget(status_label)
-        layout.addWidget(status_widget, 1)  # Equal stretch
-        
-        # App name (equal width) - will be elided if too long
-        full_name = self.app_info.name
-        name_label = ElidedLabel(full_name)
-        name_label.setStyleSheet("font-weight: 500; font-size: 14px;")
-        name_label.setWordWrap(False)  # No word wrap
-        name_label.setTextFormat(Qt.TextFormat.PlainText)
-        name_label.setToolTip(f"Application: {full_name}\nPath: {self.app_info.path if self.app_info.path else 'N/A'}")
-        layout.addWidget(name_label, 2)  # More space for name
-        
-        # Source (equal width)
-        source_label = QLabel(self.app_info.source)
-        source_label.setStyleSheet(f"""
-            background-color: #2d2d2d;
-            color: #a0a0a0;
-            border-radius: 4px;
-            padding: 4px 8px;
-            font-size: 11px;
-        """)
-        source_label.setWordWrap(False)
-        source_tooltip = f"Startup Source: {self.app_info.source}\nThis indicates where the startup entry is configured"
-        if "Registry" in self.app_info.source:
-            source_tooltip += "\n(Windows Registry)"
-        elif "Startup Folder" in self.app_info.source:
-            source_tooltip += "\n(Startup Folder)"
-        elif "Task Scheduler" in self.app_info.source:
-            source_tooltip += "\n(Task Scheduler)"
-        source_label.setToolTip(source_tooltip)
-        layout.addWidget(source_label, 1)  # Equal stretch
-        
-        # PID (equal width)
-        pid_text = self.app_info.process_id if self.app_info.process_id else "-"
-        pid_label = QLabel(pid_text)
-        pid_label.setStyleSheet("color: #a0a0a0; font-size: 12px;")
-        pid_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        if self.app_info.process_id:
-            pid_label.setToolTip(f"Process ID: {self.app_info.process_id}\nUnique identifier for the running process")
-        else:
-            pid_label.setToolTip("Process ID: Not available\nApplication is not currently running")
-        layout.addWidget(pid_label, 1)  # Equal stretch
-        
-        # Memory (equal width)
-        memory_text = "-"
-        memory_tooltip = "Memory Usage: Not available"
-        if self.app_info.memory_usage:
-            try:
-                memory_kb = int(self.app_info.memory_usage.replace(',', ''))
-                memory_mb = memory_kb / 1024
-                memory_text = f"{memory_mb:.1f} MB"
-                memory_tooltip = f"Memory Usage: {memory_text}\n({memory_kb} KB)\nRAM consumed by this process"
-            except:
-                pass
+    def rowCount(self, parent=QModelIndex()):
+        """Number of apps, or 0 for child indexes."""
+        return 0 if parent.isValid() else len(self._apps)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Number of columns, or 0 for child indexes."""
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Column titles for the horizontal header."""
+        if orientation != Qt.Orientation.Horizontal:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if section >= self.PID_COLUMN:
+                return int(Qt.AlignmentFlag.AlignCenter)
+            return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return display, decoration, color and tooltip data for a cell."""
+        if not index.isValid():
+            return None
+        app = self._apps[index.row()]
+        column = index.column()
+        
+        if column == self.STATUS_COLUMN:
+            pixmap, text, color, tooltip = self._status_info(app)
+            if role == Qt.ItemDataRole.DisplayRole:
+                return text
+            if role == Qt.ItemDataRole.DecorationRole:
+                return pixmap
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return QColor(color)
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return tooltip
+        elif column == self.NAME_COLUMN:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return app.name
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return f"Application: {app.name}\nPath: {app.path if app.path else 'N/A'}"
+        elif column == self.SOURCE_COLUMN:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return app.source
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return QColor("#a0a0a0")
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return self._source_tooltip(app)
+        elif column == self.PID_COLUMN:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return app.process_id if app.process_id else "-"
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return QColor("#a0a0a0")
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return int(Qt.AlignmentFlag.AlignCenter)
+            if role == Qt.ItemDataRole.ToolTipRole:
+                if app.process_id:
+                    return f"Process ID: {app.process_id}\nUnique identifier for the running process"
+                return "Process ID: Not available\nApplication is not currently running"
+        elif column == self.MEMORY_COLUMN:
+            if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+                memory_text, memory_tooltip = self._memory_info(app)
+                return memory_text if role == Qt.ItemDataRole.DisplayRole else memory_tooltip
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return QColor("#a0a0a0")
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return int(Qt.AlignmentFlag.AlignCenter)
+        return None
+    
+    def set_apps(self, apps):
+        """Replace all apps in the model."""
+        self.beginResetModel()
+        self._apps = list(apps)
+        self.endResetModel()
+    
+    def update_apps(self, apps):
+        """Apply a refreshed app list, touching only rows that changed.
+        
+        Rows are matched by (source, name). Vanished apps are removed, apps
+        whose state changed emit dataChanged, and new apps are inserted at
+        their position in apps, so rows keep the service's order and an
+        unchanged refresh does no view work at all.
+        """
+        new_by_key = {self._key(app): app for app in apps}
+        old_keys = {self._key(app) for app in self._apps}
+        if len(new_by_key) != len(apps) or len(old_keys) != len(self._apps):
+            # Duplicate keys can't be matched row-for-row
+            self.set_apps(apps)
+            return
+        kept_old_order = [self._key(app) for app in self._apps if self._key(app) in new_by_key]
+        kept_new_order = [self._key(app) for app in apps if self._key(app) in old_keys]
+        if kept_old_order != kept_new_order:
+            # Existing apps were reordered; a reset is simpler than row moves
+            self.set_apps(apps)
+            return
+        
+        # Remove rows whose app disappeared, bottom-up so row numbers stay valid
+        for row in range(len(self._apps) - 1, -1, -1):
+            if self._key(self._apps[row]) not in new_by_key:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._apps[row]
+                self.endRemoveRows()
+        
+        # Update remaining rows in place
+        last_column = len(self.COLUMNS) - 1
+        for row, old_app in enumerate(self._apps):
+            new_app = new_by_key[self._key(old_app)]
+            self._apps[row] = new_app
+            if self._state(new_app) != self._state(old_app):
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+        
+        # Insert new apps where the service returned them; going top-down,
+        # rows above each insertion already match apps
+        for row, app in enumerate(apps):
+            if self._key(app) not in old_keys:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._apps.insert(row, app)
+                self.endInsertRows()
+    
+    @staticmethod
+    def _key(app):
+        """Identity of an app across refreshes."""
+        return (app.source, app.name)
+    
+    @staticmethod
+    def _state(app):
+        """Fields that affect how an app's row is displayed."""
+        return (app.status, app.process_id, app.memory_usage, app.path)
+    
+    def app_at(self, row):
+        """Get the StartupAppInfo shown in row."""
+        return self._apps[row]
+    
+    @staticmethod
+    def _status_info(app):
+        """Get (pixmap, text, color, tooltip) for an app's status."""
+        color, text, tooltip = _STATUS_DISPATCH.get(app.status, _STATUS_UNKNOWN)
+        return get_pixmap('fa5s.circle', color), text, color, tooltip.format(pid=app.process_id or 'N/A')
+    
+    @staticmethod
+    def _source_tooltip(app):
+        """Build the tooltip for the source column."""
+        source_tooltip = _SOURCE_TOOLTIPS.get(app.source)
+        if source_tooltip is None:
+            source_tooltip = _SOURCE_TOOLTIP.format(source=app.source)
+        return source_tooltip
+    
+    @staticmethod
+    def _memory_info(app):
+        """Get (text, tooltip) for an app's memory usage."""
+        if app.memory_mb is None:
+            return "-", "Memory Usage: Not available\nApplication is not currently running"
+        memory_text = f"{app.memory_mb:.1f} MB"
+        return memory_text, f"Memory Usage: {memory_text}\n({app.memory_kb} KB)\nRAM consumed by this process"
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Paints kill/remove icons in the action column and handles clicks on them."""
+    
+    kill_requested = Signal(object)  # StartupAppInfo
+    delete_requested = Signal(object)  # StartupAppInfo
+    
+    ICON_SIZE = 16
+    BUTTON_SIZE = 24
+    BUTTON_SPACING = 5
+    
+    def _button_rects(self, cell_rect):
+        """Get (kill_rect, delete_rect) centered in the cell."""
+        total_width = 2 * self.BUTTON_SIZE + self.BUTTON_SPACING
+        left = cell_rect.x() + (cell_rect.width() - total_width) // 2
+        top = cell_rect.y() + (cell_rect.height() - self.BUTTON_SIZE) // 2
+        kill_rect = QRect(left, top, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        delete_rect = QRect(left + self.BUTTON_SIZE + self.BUTTON_SPACING, top, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        return kill_rect, delete_rect
+    
+    @staticmethod
+    def _can_kill(app):
+        """Check whether the app has a running process to kill."""
+        return app.status == "running" and bool(app.process_id)
+    
+    def paint(self, painter, option, index):
+        """Paint the row background plus the kill and remove icons."""
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+        
+        app = index.model().app_at(index.row())
+        kill_rect, delete_rect = self._button_rects(option.rect)
+        icon_offset = (self.BUTTON_SIZE - self.ICON_SIZE) // 2
+        
+        if self._can_kill(app):
+            painter.drawPixmap(
+                kill_rect.x() + icon_offset, kill_rect.y() + icon_offset,
+                get_pixmap('fa5s.minus-circle', '#dc3545', self.ICON_SIZE)
+            )
         else:
-            memory_tooltip = "Memory Usage: Not available\nApplication is not currently running"
-        memory_label = QLabel(memory_text)
-        memory_label.setStyleSheet("color: #a0a0a0; font-size: 12px;")
-        memory_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        memory_label.setToolTip(memory_tooltip)
-        layout.addWidget(memory_label, 1)  # Equal stretch
-        
-        # Action buttons (equal width)
-        action_layout = QHBoxLayout()
-        action_layout.setContentsMargins(0, 0, 0, 0)
-        action_layout.setSpacing(5)
-        
-        # Kill button (icon "-")
-        if self.app_info.status == "running" and self.app_info.process_id:
-            kill_button = QPushButton()
-            kill_button.setIcon(qta.icon('fa5s.minus-circle', color='#dc3545'))
-            kill_button.setToolTip(f"Kill Process\nTerminate the running process (PID: {self.app_info.process_id})\nThis will stop the application immediately")
-            kill_button.setCursor(Qt.CursorShape.PointingHandCursor)
-            kill_button.clicked.connect(lambda: self.on_kill_callback(self.app_info.process_id, self.app_info.name))
-            kill_button.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                    padding: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #3a3a3a;
-                    border-radius: 4px;
-                }
-            """)
-            action_layout.addWidget(kill_button)
+            painter.save()
+            painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+            painter.drawText(kill_rect, Qt.AlignmentFlag.AlignCenter, "-")
+            painter.restore()
+        
+        painter.drawPixmap(
+            delete_rect.x() + icon_offset, delete_rect.y() + icon_offset,
+            get_pixmap('fa5s.trash', '#dc3545', self.ICON_SIZE)
+        )
+    
+    def sizeHint(self, option, index):
+        """Room for both buttons."""
+        return QSize(2 * self.BUTTON_SIZE + self.BUTTON_SPACING, self.BUTTON_SIZE)
+    
+    def editorEvent(self, event, model, option, index):
+        """Emit kill/delete requests when an icon is clicked."""
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            app = model.app_at(index.row())
+            kill_rect, delete_rect = self._button_rects(option.rect)
+            pos = event.position().toPoint()
+            if kill_rect.contains(pos) and self._can_kill(app):
+                self.kill_requested.emit(app)
+                return True
+            if delete_rect.contains(pos):
+                self.delete_requested.emit(app)
+                return True
+        return super().editorEvent(event, model, option, index)
+    
+    def helpEvent(self, event, view, option, index):
+        """Show a tooltip for the icon under the cursor."""
+        if event.type() != QEvent.Type.ToolTip:
+            return super().helpEvent(event, view, option, index)
+        
+        app = index.model().app_at(index.row())
+        kill_rect, delete_rect = self._button_rects(option.rect)
+        if kill_rect.contains(event.pos()):
+            if self._can_kill(app):
+                tooltip = _KILL_TOOLTIP.format(pid=app.process_id)
+            else:
+                tooltip = _KILL_UNAVAILABLE_TOOLTIP
+        elif delete_rect.contains(event.pos()):
+            tooltip = _DELETE_TOOLTIP.format(name=app.name, source=app.source)
         else:
-            placeholder = QLabel("-")
-            placeholder.setToolTip("Kill Process: Not available\nApplication is not currently running")
-            action_layout.addWidget(placeholder)
-        
-        # Delete button (icon trash) - always visible
-        delete_button = QPushButton()
-        delete_button.setIcon(qta.icon('fa5s.trash', color='#dc3545'))
-        delete_source = self.app_info.source
-        delete_tooltip = f"Remove from Startup\nPermanently remove '{self.app_info.name}' from Windows startup\nSource: {delete_source}\n\nThis will prevent the app from starting automatically on boot"
-        delete_button.setToolTip(delete_tooltip)
-        delete_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        delete_button.clicked.connect(lambda: self.on_delete_callback(self.app_info))
-        delete_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                padding: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3a3a3a;
-                border-radius: 4px;
-            }
-        """)
-        action_layout.addWidget(delete_button)
-        
-        layout.addLayout(action_layout, 1)  # Equal stretch
+            QToolTip.hideText()
+            return True
+        QToolTip.showText(event.globalPos(), tooltip, view)
+        return True
+
+
+class StartupAppsView(QTableView):
+    """Table view that keeps column widths proportional to COLUMN_STRETCH."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._column_update_pending = False
+    
+    def resizeEvent(self, event):
+        """Redistribute column widths once per event loop pass while resizing."""
+        super().resizeEvent(event)
+        if not self._column_update_pending:
+            self._column_update_pending = True
+            QTimer.singleShot(0, self._apply_pending_column_widths)
+    
+    def _apply_pending_column_widths(self):
+        """Run the column update queued by resizeEvent."""
+        self._column_update_pending = False
+        self.update_column_widths()
+    
+    def update_column_widths(self):
+        """Split the viewport width across columns by their stretch factors."""
+        model = self.model()
+        if model is None:
+            return
+        stretch = model.COLUMN_STRETCH
+        width = self.viewport().width()
+        unit = width / sum(stretch)
+        header = self.horizontalHeader()
+        used = 0
+        for column, factor in enumerate(stretch[:-1]):
+            size = int(unit * factor)
+            header.resizeSection(column, size)
+            used += size
+        header.resizeSection(len(stretch) - 1, max(width - used, 0))
 
 
 class StartupStatusTab(QWidget):
     """Startup Status tab showing apps configured to start with Windows."""
     
+    refresh_requested = Signal()  # Ask the background worker for fresh data
+    
     def __init__(self, config_store, translator, parent=None):
         super().__init__(parent)
         self.config_store = config_store
         self.translator = translator
+        # Memoized lookups; cleared in refresh_ui when the language changes
+        self._t = lru_cache(maxsize=256)(self.translator.t)
         self.monitor_service = StartupMonitorService()
         self.apps_data = []  # Store apps data
         self.loading_overlay = None
+        self._refresh_in_flight = False
+        self._refresh_pending = False
+        self.init_worker()
         self.init_ui()
         self.refresh_data()
+        
+        # QPixmap is GUI-thread only, so render table icons on the next event
+        # loop pass while the worker fetches data, not during construction
+        QTimer.singleShot(0, _prewarm_table_pixmaps)
+    
+    def init_worker(self):
+        """Start the background thread that serves all refreshes."""
+        self._refresh_thread = QThread(self)
+        self.worker = RefreshWorker(self.monitor_service)
+        self.worker.moveToThread(self._refresh_thread)
+        self._refresh_thread.finished.connect(self.worker.deleteLater)
+        # Queued so each slot runs in its receiver's thread. init_worker runs
+        # once per tab, so the connections can't be duplicated; newer
+        # bindings also reject OR-ing ConnectionType flags
+        self.refresh_requested.connect(self.worker.do_refresh, Qt.ConnectionType.QueuedConnection)
+        self.worker.finished.connect(self.on_data_loaded, Qt.ConnectionType.QueuedConnection)
+        self._refresh_thread.start()
+        
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop_worker)
+    
+    def stop_worker(self):
+        """Stop the background refresh thread."""
+        self._refresh_thread.quit()
+        self._refresh_thread.wait()
     
     def init_ui(self):
         """Initialize tab UI."""
         layout = QVBoxLayout(self)
         
         # Title
-        self.title_label = QLabel(self.translator.t("starter.tabs.startup_status"))
-        self.title_label.setStyleSheet("font-size: 18px; font-weight: 600;")
+        self.title_label = QLabel(self._t("starter.tabs.startup_status"))
+        self.title_label.setStyleSheet(_TITLE_STYLE)
         layout.addWidget(self.title_label)
         
         # Description
-        self.description_label = QLabel(self.translator.t("startup_status.description"))
+        self.description_label = QLabel(self._t("startup_status.description"))
         self.description_label.setWordWrap(True)
-        self.description_label.setStyleSheet("font-size: 13px; color: #a0a0a0; margin-top: 8px;")
+        self.description_label.setStyleSheet(_DESCRIPTION_STYLE)
         layout.addWidget(self.description_label)
         
         layout.addSpacing(10)
@@ -322,14 +546,14 @@ class StartupStatusTab(QWidget):
         
         # System info
         self.system_info_label = QLabel("")
-        self.system_info_label.setStyleSheet("color: #a0a0a0; font-size: 12px;")
+        self.system_info_label.setStyleSheet(_MUTED_STYLE)
         top_layout.addWidget(self.system_info_label)
         
         top_layout.addStretch()
         
         # Refresh button
         self.refresh_button = QPushButton()
-        self.refresh_button.setIcon(qta.icon('fa5s.sync', color='white'))
+        self.refresh_button.setIcon(get_icon('fa5s.sync'))
         self.refresh_button.setToolTip("Refresh")
         self.refresh_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.refresh_button.setMaximumWidth(40)
@@ -340,62 +564,36 @@ class StartupStatusTab(QWidget):
         
         layout.addSpacing(10)
         
-        # Header row for column alignment
-        header_widget = QWidget()
-        header_widget.setStyleSheet("background-color: #252525; border-radius: 6px; padding: 8px;")
-        header_layout = QHBoxLayout(header_widget)
-        header_layout.setContentsMargins(12, 8, 12, 8)
-        header_layout.setSpacing(10)
-        
-        # Status header (equal width)
-        status_header = QLabel("Status")
-        status_header.setStyleSheet("font-weight: 600; color: #e0e0e0;")
-        header_layout.addWidget(status_header, 1)  # Equal stretch
-        
-        # Name header (more space)
-        name_header = QLabel("Application Name")
-        name_header.setStyleSheet("font-weight: 600; color: #e0e0e0;")
-        header_layout.addWidget(name_header, 2)  # More space for name
-        
-        # Source header (equal width)
-        source_header = QLabel("Source")
-        source_header.setStyleSheet("font-weight: 600; color: #e0e0e0;")
-        header_layout.addWidget(source_header, 1)  # Equal stretch
-        
-        # PID header (equal width)
-        pid_header = QLabel("PID")
-        pid_header.setStyleSheet("font-weight: 600; color: #e0e0e0;")
-        pid_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header_layout.addWidget(pid_header, 1)  # Equal stretch
-        
-        # Memory header (equal width)
-        memory_header = QLabel("Memory")
-        memory_header.setStyleSheet("font-weight: 600; color: #e0e0e0;")
-        memory_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header_layout.addWidget(memory_header, 1)  # Equal stretch
-        
-        # Action header (equal width)
-        action_header = QLabel("Action")
-        action_header.setStyleSheet("font-weight: 600; color: #e0e0e0;")
-        action_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header_layout.addWidget(action_header, 1)  # Equal stretch
-        
-        layout.addWidget(header_widget)
-        
-        # Scroll area for apps list
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        
-        # Apps container
-        self.apps_container = QWidget()
-        self.apps_layout = QVBoxLayout(self.apps_container)
-        self.apps_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.apps_layout.setSpacing(4)
-        self.apps_layout.setContentsMargins(0, 0, 0, 0)
-        
-        scroll_area.setWidget(self.apps_container)
-        layout.addWidget(scroll_area, 1)
+        # Apps table
+        self.apps_model = StartupAppsModel(self)
+        self.action_delegate = ActionButtonDelegate(self)
+        self.action_delegate.kill_requested.connect(self.on_kill_requested)
+        self.action_delegate.delete_requested.connect(self.remove_from_startup)
+        
+        self.apps_view = StartupAppsView()
+        self.apps_view.setModel(self.apps_model)
+        self.apps_view.setItemDelegateForColumn(StartupAppsModel.ACTION_COLUMN, self.action_delegate)
+        self.apps_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.apps_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.apps_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.apps_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.apps_view.setTextElideMode(Qt.TextElideMode.ElideRight)
+        self.apps_view.setWordWrap(False)
+        self.apps_view.setShowGrid(False)
+        self.apps_view.setMouseTracking(True)
+        self.apps_view.verticalHeader().hide()
+        self.apps_view.verticalHeader().setDefaultSectionSize(44)
+        self.apps_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.apps_view.horizontalHeader().setHighlightSections(False)
+        self.apps_view.setStyleSheet(_APPS_VIEW_STYLE)
+        layout.addWidget(self.apps_view, 1)
+        
+        # Shown instead of the table when there is nothing to list
+        self.no_apps_label = QLabel("No startup applications found.")
+        self.no_apps_label.setStyleSheet(_NO_APPS_STYLE)
+        self.no_apps_label.setAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignTop)
+        self.no_apps_label.hide()
+        layout.addWidget(self.no_apps_label, 1)
     
     def show_loading(self):
         """Show full-screen loading overlay."""
@@ -418,15 +616,19 @@ class StartupStatusTab(QWidget):
     
     def refresh_data(self):
         """Refresh startup apps data with loading indicator."""
+        # Coalesce requests made while a refresh is running into one follow-up
+        if self._refresh_in_flight:
+            self._refresh_pending = True
+            return
+        self._refresh_in_flight = True
+        
         # Show loading overlay
         self.show_loading()
         self.refresh_button.setEnabled(False)
         
-        # Create worker thread
-        self.worker = RefreshWorker(self.monitor_service)
-        self.worker.finished.connect(self.on_data_loaded)
-        self.worker.start()
+        self.refresh_requested.emit()
     
+    @Slot(list, dict)
     def on_data_loaded(self, apps, system_info):
         """Handle data loaded from worker thread."""
         self.apps_data = apps
@@ -440,37 +642,32 @@ class StartupStatusTab(QWidget):
         # Populate apps list
         self.populate_apps_list(apps)
         
+        self._refresh_in_flight = False
+        if self._refresh_pending:
+            # Something changed mid-refresh (e.g. a kill); fetch again
+            self._refresh_pending = False
+            self.refresh_data()
+            return
+        
         # Hide loading
         self.hide_loading()
         self.refresh_button.setEnabled(True)
     
     def populate_apps_list(self, apps):
         """Populate apps list with data."""
-        # Clear existing widgets
-        while self.apps_layout.count():
-            item = self.apps_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add app items
-        if not apps:
-            no_apps_label = QLabel("No startup applications found.")
-            no_apps_label.setStyleSheet("color: #a0a0a0; padding: 20px;")
-            no_apps_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.apps_layout.addWidget(no_apps_label)
-        else:
-            for app in apps:
-                item_widget = StartupAppItemWidget(app, self.kill_process, self.remove_from_startup)
-                item_widget.setStyleSheet("""
-                    QWidget {
-                        background-color: transparent;
-                        border-radius: 6px;
-                    }
-                    QWidget:hover {
-                        background-color: #2d2d2d;
-                    }
-                """)
-                self.apps_layout.addWidget(item_widget)
+        # Apply all row removals/inserts/changes, then repaint once
+        self.apps_view.setUpdatesEnabled(False)
+        try:
+            self.apps_model.update_apps(apps)
+            self.apps_view.setVisible(bool(apps))
+            self.no_apps_label.setVisible(not apps)
+        finally:
+            self.apps_view.setUpdatesEnabled(True)
+    
+    @Slot(object)
+    def on_kill_requested(self, app_info: StartupAppInfo):
+        """Handle a kill click from the action column."""
+        self.kill_process(app_info.process_id, app_info.name)
     
     def kill_process(self, process_id: str, app_name: str):
         """Kill a process immediately without confirmation."""
@@ -494,6 +691,7 @@ class StartupStatusTab(QWidget):
                 QMessageBox.StandardButton.Ok
             )
     
+    @Slot(object)
     def remove_from_startup(self, app_info: StartupAppInfo):
         """Remove app from Windows startup."""
         # Confirm dialog
@@ -525,7 +723,8 @@ class StartupStatusTab(QWidget):
     
     def refresh_ui(self):
         """Refresh UI after language change."""
-        self.title_label.setText(self.translator.t("starter.tabs.startup_status"))
-        self.description_label.setText(self.translator.t("startup_status.description"))
+        self._t.cache_clear()
+        self.title_label.setText(self._t("starter.tabs.startup_status"))
+        self.description_label.setText(self._t("startup_status.description"))
         # Refresh data to update list
         self.refresh_data()
@@ -2,8 +2,9 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QCheckBox, QMessageBox, QPushButton
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSignalBlocker
 import ctypes
+from functools import lru_cache
 
 from services.startup_service import StartupService
 
@@ -15,12 +16,21 @@ class TriggerTab(QWidget):
         super().__init__(parent)
         self.config_store = config_store
         self.translator = translator
+        # Memoized lookups; cleared in refresh_ui when the language changes
+        self._t = lru_cache(maxsize=256)(self.translator.t)
         self.startup_service = StartupService()
+        # Admin status can't change while the process runs
+        self._is_admin = self._probe_admin()
         self.init_ui()
         self.load_status()
     
     def is_admin(self):
         """Check if running with administrator privileges."""
+        return self._is_admin
+    
+    @staticmethod
+    def _probe_admin() -> bool:
+        """Query Windows for administrator privileges."""
         try:
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
         except:
@@ -42,14 +52,14 @@ class TriggerTab(QWidget):
                 item.widget().deleteLater()
         
         # Title
-        self.title_label = QLabel(self.translator.t("admin.trigger.title"))
+        self.title_label = QLabel(self._t("admin.trigger.title"))
         self.title_label.setStyleSheet("font-size: 18px; font-weight: 600;")
         self.main_layout.addWidget(self.title_label)
         
         self.main_layout.addSpacing(20)
         
         # Admin privilege warning (if not admin)
-        is_admin = self.is_admin()
+        is_admin = self._is_admin
         if not is_admin:
             warning_widget = QWidget()
             warning_widget.setStyleSheet("""
@@ -62,14 +72,14 @@ class TriggerTab(QWidget):
             """)
             warning_layout = QVBoxLayout(warning_widget)
             
-            warning_icon_label = QLabel("⚠️ " + self.translator.t("admin.trigger.warning_title"))
-            warning_icon_label.setStyleSheet("color: #ffda6a; font-weight: 600; font-size: 14px;")
-            warning_layout.addWidget(warning_icon_label)
+            self.warning_title_label = QLabel("⚠️ " + self._t("admin.trigger.warning_title"))
+            self.warning_title_label.setStyleSheet("color: #ffda6a; font-weight: 600; font-size: 14px;")
+            warning_layout.addWidget(self.warning_title_label)
             
-            warning_text = QLabel(self.translator.t("admin.trigger.warning_message"))
-            warning_text.setStyleSheet("color: #ffda6a; font-size: 12px;")
-            warning_text.setWordWrap(True)
-            warning_layout.addWidget(warning_text)
+            self.warning_text_label = QLabel(self._t("admin.trigger.warning_message"))
+            self.warning_text_label.setStyleSheet("color: #ffda6a; font-size: 12px;")
+            self.warning_text_label.setWordWrap(True)
+            warning_layout.addWidget(self.warning_text_label)
             
             self.main_layout.addWidget(warning_widget)
             self.main_layout.addSpacing(10)
@@ -82,14 +92,14 @@ class TriggerTab(QWidget):
         
         # Autostart checkbox
         self.autostart_checkbox = QCheckBox(
-            self.translator.t("admin.trigger.autostart_app")
+            self._t("admin.trigger.autostart_app")
         )
         self.autostart_checkbox.stateChanged.connect(self.on_autostart_changed)
         
         # Disable checkbox if not admin
         if not is_admin:
             self.autostart_checkbox.setEnabled(False)
-            self.autostart_checkbox.setToolTip(self.translator.t("admin.trigger.disabled_tooltip"))
+            self.autostart_checkbox.setToolTip(self._t("admin.trigger.disabled_tooltip"))
         
         card_layout.addWidget(self.autostart_checkbox)
         
@@ -107,7 +117,9 @@ class TriggerTab(QWidget):
     def load_status(self):
         """Load current autostart status."""
         enabled = self.startup_service.is_enabled()
-        self.autostart_checkbox.setChecked(enabled)
+        # Reflect the current state without triggering on_autostart_changed
+        with QSignalBlocker(self.autostart_checkbox):
+            self.autostart_checkbox.setChecked(enabled)
         self.update_status_label(enabled)
     
     def on_autostart_changed(self, state):
@@ -115,8 +127,9 @@ class TriggerTab(QWidget):
         enabled = (state == Qt.CheckState.Checked.value)
         
         # Double check admin privileges (should be disabled if not admin)
-        if not self.is_admin():
-            self.autostart_checkbox.setChecked(not enabled)
+        if not self._is_admin:
+            with QSignalBlocker(self.autostart_checkbox):
+                self.autostart_checkbox.setChecked(not enabled)
             return
         
         if enabled:
@@ -125,11 +138,12 @@ class TriggerTab(QWidget):
                 self.config_store.set_autostart_enabled(True)
                 self.update_status_label(True)
             else:
-                self.autostart_checkbox.setChecked(False)
+                with QSignalBlocker(self.autostart_checkbox):
+                    self.autostart_checkbox.setChecked(False)
                 QMessageBox.warning(
                     self,
-                    self.translator.t("admin.trigger.error_title"),
-                    self.translator.t("admin.trigger.enable_failed")
+                    self._t("admin.trigger.error_title"),
+                    self._t("admin.trigger.enable_failed")
                 )
         else:
             success = self.startup_service.disable()
@@ -137,30 +151,39 @@ class TriggerTab(QWidget):
                 self.config_store.set_autostart_enabled(False)
                 self.update_status_label(False)
             else:
-                self.autostart_checkbox.setChecked(True)
+                with QSignalBlocker(self.autostart_checkbox):
+                    self.autostart_checkbox.setChecked(True)
                 QMessageBox.warning(
                     self,
-                    self.translator.t("admin.trigger.error_title"),
-                    self.translator.t("admin.trigger.disable_failed")
+                    self._t("admin.trigger.error_title"),
+                    self._t("admin.trigger.disable_failed")
                 )
     
     def update_status_label(self, enabled):
         """Update status label."""
         if enabled:
             self.status_label.setText(
-                self.translator.t("admin.trigger.status_enabled")
+                self._t("admin.trigger.status_enabled")
             )
             self.status_label.setStyleSheet("color: #198754; font-size: 12px;")
         else:
             self.status_label.setText(
-                self.translator.t("admin.trigger.status_disabled")
+                self._t("admin.trigger.status_disabled")
             )
             self.status_label.setStyleSheet("color: #a0a0a0; font-size: 12px;")
     
     def refresh_ui(self):
-        """Refresh UI after language change or admin status change."""
-        # Rebuild entire UI to reflect current admin status
-        self.rebuild_ui()
-        # Reload autostart status
-        self.load_status()
+        """Refresh UI after language change.
+        
+        Admin status is fixed for the process lifetime, so the widgets
+        built by rebuild_ui stay valid and only their texts change.
+        """
+        self._t.cache_clear()
+        self.title_label.setText(self._t("admin.trigger.title"))
+        if not self._is_admin:
+            self.warning_title_label.setText("⚠️ " + self._t("admin.trigger.warning_title"))
+            self.warning_text_label.setText(self._t("admin.trigger.warning_message"))
+            self.autostart_checkbox.setToolTip(self._t("admin.trigger.disabled_tooltip"))
+        self.autostart_checkbox.setText(self._t("admin.trigger.autostart_app"))
+        self.update_status_label(self.autostart_checkbox.isChecked())
 
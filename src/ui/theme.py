@@ -1,317 +1,178 @@
 """Modern dark theme stylesheet for the application."""
-
-DARK_THEME = """
-/* Global styles */
-QWidget {
-    background-color: #1e1e1e;
-    color: #e0e0e0;
-    font-family: 'Segoe UI', Arial, sans-serif;
-    font-size: 14px;
-}
-
-/* Main window */
-QMainWindow {
-    background-color: #1e1e1e;
-}
-
-/* Sidebar */
-#sidebar {
-    background-color: #252525;
-    border-right: 1px solid #3a3a3a;
-}
-
-/* Sidebar buttons */
-#sidebar QPushButton {
-    background-color: transparent;
-    color: #e0e0e0;
-    border: none;
-    border-radius: 0px;
-    padding: 12px 16px;
-    text-align: left;
-    margin: 2px 8px;
-}
-
-#sidebar QPushButton:hover {
-    background-color: #2d2d2d;
-}
-
-#sidebar QPushButton:checked {
-    background-color: #0d6efd;
-    color: white;
-}
-
-/* Content area */
-#content {
-    background-color: #1e1e1e;
-}
-
-/* Tab widget */
-QTabWidget::pane {
-    border: none;
-    background-color: #1e1e1e;
-}
-
-QTabBar::tab {
-    background-color: transparent;
-    color: #a0a0a0;
-    border: none;
-    border-radius: 0px;
-    padding: 10px 20px;
-    margin-right: 4px;
-}
-
-QTabBar::tab:hover {
-    background-color: #2d2d2d;
-    color: #e0e0e0;
-}
-
-QTabBar::tab:selected {
-    background-color: transparent;
-    color: #0d6efd;
-    border-bottom: 2px solid #0d6efd;
-}
-
-/* Cards */
-.card {
-    background-color: transparent;
-    border-radius: 12px;
-    border: 1px solid #3a3a3a;
-    padding: 20px;
-}
-
-/* Input fields */
-QLineEdit, QTextEdit {
-    background-color: #2d2d2d;
-    border: 1px solid #3a3a3a;
-    border-radius: 8px;
-    padding: 8px 12px;
-    color: #e0e0e0;
-}
-
-QLineEdit:focus, QTextEdit:focus {
-    border: 1px solid #0d6efd;
-}
-
-/* Buttons */
-QPushButton {
-    background-color: #0d6efd;
-    color: white;
-    border: none;
-    border-radius: 8px;
-    padding: 8px 16px;
-    font-weight: 500;
-}
-
-QPushButton:hover {
-    background-color: #0b5ed7;
-}
-
-QPushButton:pressed {
-    background-color: #0a58ca;
-}
-
-QPushButton:disabled {
-    background-color: #3a3a3a;
-    color: #6c6c6c;
-}
-
-/* Secondary button */
-QPushButton[class="secondary"] {
-    background-color: #2d2d2d;
-    color: #e0e0e0;
-}
-
-QPushButton[class="secondary"]:hover {
-    background-color: #3a3a3a;
-}
-
-/* Danger button */
-QPushButton[class="danger"] {
-    background-color: #dc3545;
-}
-
-QPushButton[class="danger"]:hover {
-    background-color: #bb2d3b;
-}
-
-/* Icon button */
-QPushButton[class="icon"] {
-    background-color: transparent;
-    padding: 6px;
-    border-radius: 6px;
-}
-
-QPushButton[class="icon"]:hover {
-    background-color: #3a3a3a;
-}
-
-/* ComboBox */
-QComboBox {
-    background-color: #2d2d2d;
-    border: 1px solid #3a3a3a;
-    border-radius: 8px;
-    padding: 8px 12px;
-    color: #e0e0e0;
-}
-
-QComboBox:hover {
-    border: 1px solid #0d6efd;
-}
-
-QComboBox::drop-down {
-    border: none;
-}
-
-QComboBox QAbstractItemView {
-    background-color: #2d2d2d;
-    border: 1px solid #3a3a3a;
-    selection-background-color: #0d6efd;
-    color: #e0e0e0;
-}
-
-/* CheckBox */
-QCheckBox {
-    color: #e0e0e0;
-    spacing: 8px;
-}
-
-QCheckBox::indicator {
-    width: 18px;
-    height: 18px;
-    border-radius: 4px;
-    border: 2px solid #3a3a3a;
-    background-color: #2d2d2d;
-}
-
-QCheckBox::indicator:hover {
-    border-color: #0d6efd;
-}
-
-QCheckBox::indicator:checked {
-    background-color: #0d6efd;
-    border-color: #0d6efd;
-    image: url(none);
-}
-
-/* RadioButton */
-QRadioButton {
-    color: #e0e0e0;
-    spacing: 8px;
-}
-
-QRadioButton::indicator {
-    width: 18px;
-    height: 18px;
-    border-radius: 9px;
-    border: 2px solid #3a3a3a;
-    background-color: #2d2d2d;
-}
-
-QRadioButton::indicator:hover {
-    border-color: #0d6efd;
-}
-
-QRadioButton::indicator:checked {
-    background-color: #0d6efd;
-    border-color: #0d6efd;
-}
-
-/* ScrollBar */
-QScrollBar:vertical {
-    background-color: #1e1e1e;
-    width: 12px;
-    border-radius: 6px;
-}
-
-QScrollBar::handle:vertical {
-    background-color: #3a3a3a;
-    border-radius: 6px;
-    min-height: 20px;
-}
-
-QScrollBar::handle:vertical:hover {
-    background-color: #4a4a4a;
-}
-
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-    border: none;
-    background: none;
-}
-
-QScrollBar:horizontal {
-    background-color: #1e1e1e;
-    height: 12px;
-    border-radius: 6px;
-}
-
-QScrollBar::handle:horizontal {
-    background-color: #3a3a3a;
-    border-radius: 6px;
-    min-width: 20px;
-}
-
-QScrollBar::handle:horizontal:hover {
-    background-color: #4a4a4a;
-}
-
-QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-    border: none;
-    background: none;
-}
-
-/* List widget */
-QListWidget {
-    background-color: #2d2d2d;
-    border: 1px solid #3a3a3a;
-    border-radius: 8px;
-    padding: 4px;
-}
-
-QListWidget::item {
-    background-color: transparent;
-    border-radius: 6px;
-    padding: 8px;
-    color: #e0e0e0;
-}
-
-QListWidget::item:hover {
-    background-color: #3a3a3a;
-}
-
-QListWidget::item:selected {
-    background-color: #0d6efd;
-    color: white;
-}
-
-/* Label */
-QLabel {
-    color: #e0e0e0;
-}
-
-/* Badge */
-QLabel[class="badge"] {
-    background-color: #0d6efd;
-    color: white;
-    border-radius: 4px;
-    padding: 2px 8px;
-    font-size: 12px;
-}
-
-QLabel[class="badge-browser"] {
-    background-color: #0dcaf0;
-}
-
-QLabel[class="badge-app"] {
-    background-color: #6c757d;
-}
-
-QLabel[class="badge-working"] {
-    background-color: #198754;
-}
-"""
-
-
-def apply_theme(app):
-    """Apply the dark theme to the application."""
-    app.setStyleSheet(DARK_THEME)
-
+import re
+import string
+import sys
+import weakref
+from functools import lru_cache
+from pathlib import Path
+from typing import Final, Optional, Tuple
+
+from PySide6.QtGui import QColor, QFont, QPalette
+
+# Theme colors; build_theme() renders the templates with a palette like this
+PALETTE = {
+    "bg": "#1e1e1e",
+    "panel": "#252525",
+    "surface": "#2d2d2d",
+    "border": "#3a3a3a",
+    "handle_hover": "#4a4a4a",
+    "fg": "#e0e0e0",
+    "fg_muted": "#a0a0a0",
+    "fg_disabled": "#6c6c6c",
+    "fg_on_accent": "white",
+    "accent": "#0d6efd",
+    "accent_hover": "#0b5ed7",
+    "accent_pressed": "#0a58ca",
+    "danger": "#dc3545",
+    "danger_hover": "#bb2d3b",
+}
+
+# Base colors go through the main window's palette rather than a global
+# QWidget rule, so plain widgets keep the native style's paint path. Base
+# matches the old global background so item views keep their look
+_PALETTE_ROLES = (
+    (QPalette.ColorRole.Window, "bg"),
+    (QPalette.ColorRole.WindowText, "fg"),
+    (QPalette.ColorRole.Base, "bg"),
+    (QPalette.ColorRole.AlternateBase, "panel"),
+    (QPalette.ColorRole.Text, "fg"),
+    (QPalette.ColorRole.Button, "surface"),
+    (QPalette.ColorRole.ButtonText, "fg"),
+    (QPalette.ColorRole.ToolTipBase, "surface"),
+    (QPalette.ColorRole.ToolTipText, "fg"),
+    (QPalette.ColorRole.PlaceholderText, "fg_muted"),
+    (QPalette.ColorRole.Highlight, "accent"),
+    (QPalette.ColorRole.HighlightedText, "fg_on_accent"),
+)
+
+_DISABLED_ROLES = (
+    QPalette.ColorRole.WindowText,
+    QPalette.ColorRole.Text,
+    QPalette.ColorRole.ButtonText,
+)
+
+
+# Set once on the main window instead of a QSS font rule, which Qt would
+# re-resolve through the font database for every polished widget
+_FONT_FAMILIES = ["Segoe UI", "Arial", "sans-serif"]
+_FONT_PIXEL_SIZE = 14
+
+
+def build_font():
+    """Build the main window's base font."""
+    font = QFont()
+    font.setFamilies(_FONT_FAMILIES)
+    font.setPixelSize(_FONT_PIXEL_SIZE)
+    return font
+
+
+def build_palette(palette):
+    """Build the main window's QPalette from the given color palette."""
+    qpalette = QPalette()
+    for role, key in _PALETTE_ROLES:
+        qpalette.setColor(role, QColor(palette[key]))
+    for role in _DISABLED_ROLES:
+        qpalette.setColor(QPalette.ColorGroup.Disabled, role, QColor(palette["fg_disabled"]))
+    return qpalette
+
+
+# QSS templates live next to this module as data files:
+# dark_root.qss is set on QApplication (main window background),
+# dark_window.qss on the main window only so it doesn't cascade into
+# unrelated top-level windows
+_THEME_DIR: Final = Path(__file__).parent / "themes"
+THEME_SHEETS: Final = ("dark_root", "dark_window")
+
+
+@lru_cache(maxsize=None)
+def _load_template(name):
+    """Read a QSS template from the themes folder."""
+    with open(_THEME_DIR / f"{name}.qss", "r", encoding="utf-8") as f:
+        return string.Template(f.read())
+
+
+def build_theme(palette):
+    """Render the (root, window) stylesheets with the given color palette."""
+    return tuple(_load_template(name).substitute(palette) for name in THEME_SHEETS)
+
+
+def prebuilt_filename(name):
+    """File name of the pre-minified sheet written by build_theme.py."""
+    return f"{name}.min.qss"
+
+
+_COMMENT_OR_SPACE_RE = re.compile(r"/\*.*?\*/|\s+", re.DOTALL)
+_PUNCTUATION_SPACE_RE = re.compile(r"\s*([{}:;,])\s*")
+
+
+def _minify_qss(qss):
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    qss = _COMMENT_OR_SPACE_RE.sub(" ", qss)
+    qss = _PUNCTUATION_SPACE_RE.sub(r"\1", qss)
+    return qss.replace(";}", "}").strip()
+
+
+def render_theme_qss(palette=PALETTE):
+    """Render and minify the (root, window) stylesheets from the templates."""
+    return tuple(_minify_qss(qss) for qss in build_theme(palette))
+
+
+def _read_prebuilt_qss():
+    """Read the pre-minified sheets, or None if they weren't generated.
+    
+    Only packaged builds use them; they are generated at build time, so a
+    source run always renders the templates and sees edits to them.
+    """
+    if not getattr(sys, "frozen", False):
+        return None
+    sheets = []
+    for name in THEME_SHEETS:
+        try:
+            with open(_THEME_DIR / prebuilt_filename(name), "r", encoding="utf-8") as f:
+                sheets.append(f.read())
+        except FileNotFoundError:
+            return None
+    return tuple(sheets)
+
+
+# Built (root, window) sheets. importlib.reload() re-runs this module in the
+# same namespace, so pick up the previous run's strings instead of
+# rebuilding them
+_qss_cache: Optional[Tuple[str, str]] = globals().get("_qss_cache")
+
+
+def get_theme_qss():
+    """Return the minified (root, window) dark theme, loaded on first use.
+    
+    Packaged builds ship the sheets pre-minified by build_theme.py; from a
+    source checkout they are rendered from the templates instead.
+    """
+    global _qss_cache
+    if _qss_cache is None:
+        sheets = _read_prebuilt_qss() or render_theme_qss()
+        _qss_cache = tuple(sys.intern(qss) for qss in sheets)
+    return _qss_cache
+
+
+# Targets already carrying their sheet; setting it again would make Qt
+# re-parse the sheet and re-polish every widget for no visible change
+_applied = weakref.WeakSet()
+
+
+def apply_theme(app, main_window=None):
+    """Apply the dark theme (once per target).
+    
+    The small root sheet goes on the application; the font, palette and
+    bulk of the theme are set on main_window so other top-level windows and
+    dialogs keep their own look and restyling stays scoped to that tree.
+    """
+    root_qss, window_qss = get_theme_qss()
+    if app not in _applied:
+        app.setStyleSheet(root_qss)
+        app.setProperty("_theme_installed", True)
+        _applied.add(app)
+    if main_window is not None and main_window not in _applied:
+        main_window.setFont(build_font())
+        main_window.setPalette(build_palette(PALETTE))
+        main_window.setStyleSheet(window_qss)
+        _applied.add(main_window)
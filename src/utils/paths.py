@@ -1,27 +1,40 @@
 """Path utilities for Windows paths."""
+import functools
 import os
+import tempfile
 from pathlib import Path
-from typing import List
+from typing import Tuple
 
 
-def get_start_menu_paths() -> List[Path]:
+# Resolved once at import; the environment doesn't change under us
+_APPDATA = os.environ.get("APPDATA", "")
+_PROGRAMDATA = os.environ.get("PROGRAMDATA", "")
+_START_MENU_PROGRAMS = ("Microsoft", "Windows", "Start Menu", "Programs")
+# Plain strings: scanners hand these straight to os.walk/os.scandir
+_USER_START = os.path.join(_APPDATA, *_START_MENU_PROGRAMS) if _APPDATA else None
+_ALL_START = os.path.join(_PROGRAMDATA, *_START_MENU_PROGRAMS) if _PROGRAMDATA else None
+# Either variable can be missing (services, non-Windows shells); fall back
+# instead of letting Path(None) raise
+_APP_DATA_DIR = Path(_APPDATA or tempfile.gettempdir(), "StarterAppLauncher")
+
+
+@functools.lru_cache(maxsize=1)
+def get_start_menu_paths_str() -> Tuple[str, ...]:
+    """Get Start Menu program paths as plain strings (resolved once per process)."""
+    # User Start Menu first, then All Users; tuple so callers can't
+    # mutate the cached value
+    return tuple(
+        path for path in (_USER_START, _ALL_START)
+        if path is not None and os.path.isdir(path)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_start_menu_paths() -> Tuple[Path, ...]:
     """Get Start Menu program paths."""
-    paths = []
-    
-    # User Start Menu
-    user_path = Path(os.getenv("APPDATA")) / "Microsoft" / "Windows" / "Start Menu" / "Programs"
-    if user_path.exists():
-        paths.append(user_path)
-    
-    # All Users Start Menu
-    all_users_path = Path(os.getenv("PROGRAMDATA")) / "Microsoft" / "Windows" / "Start Menu" / "Programs"
-    if all_users_path.exists():
-        paths.append(all_users_path)
-    
-    return paths
+    return tuple(Path(path) for path in get_start_menu_paths_str())
 
 
 def get_app_data_dir() -> Path:
     """Get application data directory."""
-    return Path(os.getenv("APPDATA")) / "StarterAppLauncher"
-
+    return _APP_DATA_DIR